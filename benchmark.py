@@ -0,0 +1,227 @@
+"""Benchmark headless: loop GameController + GameView asli tanpa jendela & tanpa batas FPS.
+
+Contoh:
+    python benchmark.py --frames 1200 --path sweep --grass 6000 --animals 20 --output hasil.json
+    python benchmark.py --baseline hasil_main.json --max-regression 0.10
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import subprocess
+
+# Harus di-set sebelum pygame di-import
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import src.config as config
+
+# Metrik yang dibandingkan dengan baseline (--baseline)
+GATED_METRICS = ("mean", "p95", "p99")
+
+# Laju frame virtual benchmark (bukan batas FPS; loop tetap tanpa batas)
+RENDER_HZ = 60
+
+
+def _sweep(tick):
+    """Bolak-balik horizontal menyapu map, turun sedikit di tiap ujung"""
+    leg, step_down = 360, 40
+    phase = tick % (2 * (leg + step_down))
+    if phase < leg:
+        return 1, 0
+    if phase < leg + step_down:
+        return 0, 1
+    if phase < 2 * leg + step_down:
+        return -1, 0
+    return 0, -1
+
+def _circle(tick):
+    """Putar 8 arah, 30 tick per arah"""
+    dirs = ((1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1), (0, -1), (1, -1))
+    return dirs[(tick // 30) % len(dirs)]
+
+def _diagonal(tick):
+    return (1, 1) if (tick // 300) % 2 == 0 else (-1, -1)
+
+# Jalur gerak player: tick simulasi -> (dx, dy)
+PATHS = {
+    "idle": lambda tick: (0, 0),
+    "sweep": _sweep,
+    "circle": _circle,
+    "diagonal": _diagonal,
+}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark frame time headless")
+    parser.add_argument("--frames", type=int, default=600, help="jumlah frame yang diukur")
+    parser.add_argument("--warmup", type=int, default=60, help="frame awal yang tidak diukur")
+    parser.add_argument("--path", choices=sorted(PATHS), default="sweep", help="jalur gerak player")
+    parser.add_argument("--seed", type=int, default=0, help="seed dunia (sama -> dunia & simulasi sama)")
+    parser.add_argument("--grass", type=int, default=3000, help="jumlah clump rumput")
+    parser.add_argument("--animals", type=int, default=1, help="jumlah hewan per spesies")
+    parser.add_argument("--species", action="append", default=[], metavar="NAMA=N",
+                        help="jumlah hewan untuk satu spesies (menimpa --animals), boleh diulang")
+    parser.add_argument("--trees", type=int, default=0, help="pohon interaktif tambahan")
+    parser.add_argument("--cats", type=int, default=1)
+    parser.add_argument("--map-scale", type=float, default=1.0, help="pengali ukuran map")
+    parser.add_argument("--backend", choices=("object", "numpy"), default=config.SIMULATION_BACKEND)
+    parser.add_argument("--scheduler", choices=("full", "lod", "budget"), default=config.ENTITY_SCHEDULER,
+                        help="penjadwal update entity")
+    parser.add_argument("--threaded", action="store_true", default=config.THREADED_SIMULATION,
+                        help="simulasi Population (backend numpy) di worker thread")
+    parser.add_argument("--ground-chunks", action="store_true", help="pakai GroundLayer (rumput di-bake)")
+    parser.add_argument("--dirty-rects", action="store_true", help="pakai render dirty-rect")
+    parser.add_argument("--output", metavar="PATH", help="tulis hasil JSON ke PATH")
+    parser.add_argument("--baseline", metavar="PATH", help="hasil JSON pembanding (misal dari commit main)")
+    parser.add_argument("--max-regression", type=float, default=0.10,
+                        help="batas kenaikan frame time relatif terhadap baseline (0.10 = 10%%)")
+    return parser.parse_args(argv)
+
+
+def _scale_map(scale):
+    """Perbesar map sebelum modul game di-import (modul meng-import konstanta MAP_* saat load)"""
+    if scale == 1.0:
+        return
+    config.MAP_WIDTH = int(config.MAP_WIDTH * scale)
+    config.MAP_HEIGHT = int(config.MAP_HEIGHT * scale)
+    config.MAP_RECT = pygame.Rect(0, 0, config.MAP_WIDTH, config.MAP_HEIGHT)
+
+
+def _species_counts(args, spawns):
+    counts = {species: args.animals for species, _, _ in spawns}
+    for item in args.species:
+        name, _, n = item.partition("=")
+        if name not in counts:
+            raise SystemExit(f"Spesies tidak dikenal: {name} (pilihan: {', '.join(counts)})")
+        counts[name] = int(n)
+    return counts
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL,
+                                       cwd=config.BASE_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    _scale_map(args.map_scale)
+    # Import setelah map di-scale
+    from src.views.game_view import GameView
+    from src.views.ground_layer import GroundLayer
+    from src.world import ANIMAL_SPAWNS, create_world, simulate_tick, render_frame
+    from src.utils.timestep import FixedTimestep
+    from src.utils.profiler import frame_profiler
+
+    pygame.display.init()
+    pygame.font.init()
+    screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+    start = time.perf_counter()
+    controller = create_world(args.grass, _species_counts(args, ANIMAL_SPAWNS), args.trees, args.cats, args.backend,
+                              args.seed, args.scheduler, args.threaded)
+    ground_layer = GroundLayer(controller.grass_clumps) if args.ground_chunks else None
+    view = GameView(screen, ground_layer, dirty_rects=args.dirty_rects)
+    setup_seconds = time.perf_counter() - start
+
+    path = PATHS[args.path]
+    timestep = FixedTimestep()
+    frame_profiler.window = max(args.frames, 1)
+    for frame in range(args.warmup + args.frames):
+        if frame == args.warmup:
+            frame_profiler.set_enabled(True)
+        frame_profiler.begin_frame()
+        pygame.event.pump()
+        # Jam virtual: tiap frame dianggap 1/RENDER_HZ detik, jadi pola tick & animasi
+        # sama di setiap run walau frame-nya tidak dibatasi
+        for _ in range(timestep.advance(1.0 / RENDER_HZ)):
+            simulate_tick(controller, path(timestep.ticks))
+        render_frame(controller, view, frame / RENDER_HZ, timestep.alpha)
+        frame_profiler.end_frame()
+
+    stats = frame_profiler.stats()
+    counters = set(frame_profiler.counter_names())
+    result = {
+        "commit": _git_commit(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("output", "baseline", "max_regression")},
+        "entities": {
+            "animals": len(controller.animals),
+            "cats": len(controller.cats),
+            "trees": len(controller.trees),
+            "boundary_trees": len(controller.boundary_trees),
+            "grass": len(controller.grass_clumps),
+        },
+        "sim_hz": config.SIM_HZ,
+        "sim_ticks": timestep.ticks,
+        "scheduler": controller.scheduler.stats() if hasattr(controller.scheduler, "stats") else None,
+        "threaded": controller.sim_worker is not None,
+        "setup_seconds": setup_seconds,
+        "frame_ms": stats.pop("frame", {}),
+        "phases_ms": {name: s for name, s in stats.items() if name not in counters},
+        "counters": {name: s for name, s in stats.items() if name in counters},
+        "python": sys.version.split()[0],
+        "pygame": pygame.version.ver,
+        "platform": platform.platform(),
+    }
+    frame_profiler.set_enabled(False)
+    controller.close()
+    pygame.quit()
+    return result
+
+
+def summary(result):
+    f = result["frame_ms"]
+    lines = [
+        f"commit {result['commit']}  {result['params']['frames']} frame  path={result['params']['path']}  "
+        f"entitas={result['entities']}",
+        f"frame  mean {f['mean']:.2f} ms  p50 {f['p50']:.2f}  p95 {f['p95']:.2f}  p99 {f['p99']:.2f}  max {f['max']:.2f}",
+    ]
+    for name, s in result["phases_ms"].items():
+        lines.append(f"  {name:<18} mean {s['mean']:7.3f}  p95 {s['p95']:7.3f}  p99 {s['p99']:7.3f} ms")
+    for name, s in result["counters"].items():
+        lines.append(f"  {name:<18} mean {s['mean']:9.1f}  max {s['max']:9.0f}")
+    if result["scheduler"]:
+        lines.append("  scheduler " + "  ".join(f"{k}={v:.1f}" for k, v in result["scheduler"].items()))
+    return "\n".join(lines)
+
+
+def compare(result, baseline, max_regression):
+    """Bandingkan frame time dengan baseline. Mengembalikan daftar pesan regresi"""
+    if baseline.get("params") != result["params"]:
+        print("[WARNING] Parameter benchmark berbeda dengan baseline; hasil mungkin tidak sebanding")
+    failures = []
+    for metric in GATED_METRICS:
+        old, new = baseline["frame_ms"][metric], result["frame_ms"][metric]
+        change = new / old - 1.0 if old else 0.0
+        print(f"  {metric:<5} {old:8.2f} -> {new:8.2f} ms ({change:+.1%})")
+        if change > max_regression:
+            failures.append(f"{metric} naik {change:.1%} (batas {max_regression:.0%})")
+    return failures
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    result = run(args)
+    print(summary(result))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"Hasil ditulis ke {args.output}")
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Dibanding baseline (commit {baseline.get('commit')}):")
+        failures = compare(result, baseline, args.max_regression)
+        if failures:
+            print("REGRESI: " + "; ".join(failures))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,76 @@ import os
 # KONSTANTA KONFIGURASI GAME
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
-FPS = 60
+FPS = 60  # Batas FPS render (0 = tanpa batas)
 PLAYER_SPEED = 3
 INTERACTION_DISTANCE = 80
 
+# Simulasi fixed-timestep: dunia maju SIM_HZ tick per detik berapa pun FPS render,
+# posisi di antara dua tick di-interpolasi saat render
+SIM_HZ = 30
+MAX_SIM_STEPS = 5  # Batas tick per frame; sisa waktu dibuang (mencegah spiral of death)
+# Kecepatan, durasi (frame) & laju animasi di kode dan tabel spesies ditulis per tick 60 Hz;
+# nilai per tick dikali TICK_SCALE supaya gameplay sama untuk SIM_HZ berapa pun
+BASE_TICK_HZ = 60
+TICK_SCALE = BASE_TICK_HZ / SIM_HZ
+
 MAP_WIDTH = SCREEN_WIDTH * 3
 MAP_HEIGHT = SCREEN_HEIGHT * 3
 MAP_RECT = pygame.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT)
 TILE_SIZE = 64 
+GRID_CELL_SIZE = 256  # Ukuran cell spatial grid (culling & query jarak)
+ASSET_CACHE_MAX_BYTES = 64 * 1024 * 1024  # Batas cache sprite yang di-decode
+
+# Ground layer statis: rumput di-bake ke chunk (rumput tidak bergoyang)
+STATIC_GROUND_CHUNKS = False
+GROUND_CHUNK_SIZE = 512
+GROUND_CHUNK_CACHE = 12  # Jumlah chunk yang disimpan di memori (LRU)
+
+# Render dirty-rect: saat kamera diam hanya area yang berubah yang digambar ulang
+DIRTY_RECT_RENDERING = False
+DIRTY_TILE_SIZE = 64     # Granularitas penggabungan area kotor (piksel)
+DIRTY_FULL_RATIO = 0.5   # Di atas porsi layar ini, redraw penuh
+
+TEXT_CACHE_SIZE = 256  # Jumlah surface teks/panel HUD yang di-cache (LRU)
+
+# Minimap: overlay hewan diperbarui MINIMAP_HZ kali per detik; di atas
+# MINIMAP_DENSITY_THRESHOLD hewan digambar sebagai tekstur kepadatan
+MINIMAP_SCALE = 0.08
+MINIMAP_HZ = 10
+MINIMAP_DENSITY_THRESHOLD = 300
+MINIMAP_DENSITY_CELL = 4  # Ukuran cell kepadatan (piksel minimap)
+
+# Profiler frame (F3): riwayat bergulir untuk percentile & laju refresh overlay
+FRAME_PROFILE_WINDOW = 240  # Frame
+PERF_OVERLAY_HZ = 4
+
+# Jumlah proses untuk rasterize sprite pohon boundary (None = semua core, 0/1 = serial).
+# Default serial: paling banyak ~40 sprite kecil, sedangkan tiap worker (spawn di
+# Windows) meng-import ulang pygame, numpy & cairo. Ukur dengan --profile-startup
+# (fase "procedural") sebelum menyalakan pool
+BOUNDARY_TREE_WORKERS = 0
+
+# Seed dunia: posisi spawn, rumput, pohon boundary & AI hewan diturunkan dari sini.
+# None = seed acak tiap run (dicetak ke konsol supaya bisa diulang)
+WORLD_SEED = None
+
+# Penjadwal update hewan & kucing (backend object):
+#   "full"   semua entity di-update penuh tiap tick
+#   "lod"    entity dalam kamera + LOD_NEAR_MARGIN disimulasi & dianimasi penuh tiap tick;
+#            sisanya hanya bergerak kasar tiap LOD_FAR_INTERVAL tick tanpa animasi,
+#            lalu dikejar saat masuk pandangan
+#   "budget" round-robin dalam ENTITY_UPDATE_BUDGET_MS per tick; tick yang terlewat
+#            dikejar saat giliran entity tiba
+ENTITY_SCHEDULER = "full"
+ENTITY_UPDATE_BUDGET_MS = 3.0
+LOD_NEAR_MARGIN = 200  # Piksel
+LOD_FAR_INTERVAL = 8   # Tick
+
+# Backend simulasi hewan: "object" (satu Animal per hewan) atau "numpy" (Population, butuh NumPy)
+SIMULATION_BACKEND = "object"
+# Backend "numpy": jalankan Population di worker thread, overlap dengan render.
+# Render memakai hasil batch tick frame sebelumnya (double buffer)
+THREADED_SIMULATION = False
 
 # WARNA
 WHITE = (255, 255, 255)
@@ -28,5 +90,15 @@ GRASS_COLORS = [
     (60, 150, 70), (25, 90, 35)
 ]
 
+# Atlas goyangan rumput: jumlah fase yang di-render sebelumnya (0 = goyang dengan translasi)
+GRASS_SWAY_PHASES = 0
+GRASS_SWAY_BEND = 5  # Lengkungan maksimum ujung helai (piksel)
+GRASS_SPRITE_SEED = 1  # Seed varian sprite clump (sprite di-cache di disk per seed)
+
 # Base directory
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cache disk untuk sprite procedural (cairo): start berikutnya tidak perlu rasterize ulang
+SPRITE_DISK_CACHE = True
+SPRITE_CACHE_DIR = os.path.join(BASE_DIR, ".cache", "sprites")
+SPRITE_CACHE_MAX_BYTES = 32 * 1024 * 1024
@@ -0,0 +1,89 @@
+import time
+from collections import deque
+from src.config import ENTITY_UPDATE_BUDGET_MS
+from src.utils.profiler import frame_profiler, percentile
+
+STALENESS_WINDOW = 2048  # Jumlah update terakhir untuk statistik staleness
+
+
+class BudgetScheduler:
+    """Update entity round-robin dalam batas waktu per tick.
+
+    Tiap tick entity di-update bergiliran mulai dari posisi terakhir sampai
+    `budget_ms` habis (minimal `min_updates` entity). Entity yang terlewat
+    mengumpulkan tick tertunda dan di-update dengan semua tick itu sekaligus,
+    jadi posisinya tetap benar walau lebih jarang di-update. Staleness
+    (jumlah tick sejak update sebelumnya) dicatat untuk menyetel budget.
+    """
+
+    def __init__(self, budget_ms=ENTITY_UPDATE_BUDGET_MS, min_updates=1):
+        self.budget = budget_ms / 1000.0
+        self.min_updates = min_updates
+        self.tick = 0
+        self._entities = []
+        self._cursor = 0
+        self._last = {}  # id(entity) -> tick terakhir di-update
+        self._staleness = deque(maxlen=STALENESS_WINDOW)
+        self.updated_last_tick = 0
+
+    def _assign(self, entities, now):
+        self._entities = list(entities)
+        self._cursor %= max(len(self._entities), 1)
+        for e in self._entities:
+            self._last.setdefault(id(e), now - 1)
+
+    def catch_up(self, e, now, grid):
+        """Kejar tick tertunda sampai sebelum tick `now` (dipanggil sebelum transisi state)"""
+        key = id(e)
+        pending = now - 1 - self._last.get(key, now - 1)
+        if pending > 0:
+            e.update(pending)
+            self._last[key] = now - 1
+            grid.update(e)
+
+    def update(self, entities, camera, grid, now):
+        """Tick simulasi `now` untuk `entities` (semuanya terdaftar di `grid`)"""
+        if len(entities) != len(self._entities):
+            self._assign(entities, now)
+        self.tick = now
+        items = self._entities
+        n = len(items)
+        if not n:
+            return
+        last = self._last
+        staleness = self._staleness
+        deadline = time.perf_counter() + self.budget
+        cursor = self._cursor
+        updated = 0
+        worst = 0
+        while updated < n:
+            e = items[cursor]
+            key = id(e)
+            ticks = now - last[key]
+            e.update(ticks)
+            grid.update(e)
+            last[key] = now
+            staleness.append(ticks)
+            if ticks > worst:
+                worst = ticks
+            updated += 1
+            cursor = (cursor + 1) % n
+            if updated >= self.min_updates and time.perf_counter() >= deadline:
+                break
+        self._cursor = cursor
+        self.updated_last_tick = updated
+        frame_profiler.count("sched_updated", updated)
+        frame_profiler.max("sched_stale_max", worst)
+
+    def stats(self):
+        """Staleness entity (dalam tick): dari update terakhir dan yang sedang tertunda"""
+        recent = sorted(self._staleness)
+        pending = [self.tick - t for t in self._last.values()]
+        return {
+            "entities": len(self._entities),
+            "updated_last_tick": self.updated_last_tick,
+            "mean_staleness": sum(recent) / len(recent) if recent else 0.0,
+            "p95_staleness": percentile(recent, 95),
+            "max_staleness": recent[-1] if recent else 0,
+            "max_pending": max(pending, default=0),
+        }
@@ -1,10 +1,22 @@
 import pygame
-from src.config import MAP_RECT, INTERACTION_DISTANCE
+from src.config import MAP_RECT, INTERACTION_DISTANCE, ENTITY_SCHEDULER, THREADED_SIMULATION
 from src.utils.helpers import calculate_distance
+from src.utils.spatial_grid import SpatialGrid
 from src.views.info_popup import InfoPopup
+from src.controllers.lod_scheduler import LodScheduler, LOD_KINDS
+from src.controllers.budget_scheduler import BudgetScheduler
+from src.controllers.sim_worker import SimulationWorker
+from src.utils.profiler import frame_profiler
+from src.utils.timestep import RectInterpolator
+from src.utils.timer_wheel import TimerWheel
+from src.models.animal import MOVING_STATES
+
+INTERACTABLE_KINDS = ("tree", "animal", "cat")
+ENTITY_SCHEDULERS = {"full": None, "lod": LodScheduler, "budget": BudgetScheduler}
 
 class GameController:
-    def __init__(self, player, trees, animals, cats, grass_clumps, boundary_trees=None):
+    def __init__(self, player, trees, animals, cats, grass_clumps, boundary_trees=None, spatial_grid=None, population=None,
+                 scheduler=ENTITY_SCHEDULER, threaded=THREADED_SIMULATION):
         self.player = player
         self.trees = trees
         self.animals = animals
@@ -14,17 +26,74 @@ class GameController:
         self.camera = pygame.Rect(0, 0, 0, 0)  # Will be set in update_camera
         self.popup = None
         self.can_interact_with = None
+        self.spatial_grid = spatial_grid if spatial_grid is not None else SpatialGrid()
+        self.population = population  # Population (NumPy) opsional; hewannya tidak masuk grid
+        # Worker thread untuk Population (opsional); self.population tetap buffer yang dibaca render
+        self.sim_worker = SimulationWorker(population) if threaded and population is not None else None
+        self.interpolator = RectInterpolator()
+        # Penjadwal update entity (None = semua di-update penuh tiap tick)
+        scheduler_cls = ENTITY_SCHEDULERS[scheduler]
+        self.scheduler = scheduler_cls() if scheduler_cls else None
+        
+        # Transisi state AI dijadwalkan di timer wheel: tiap tick hanya entity
+        # yang transisinya jatuh tempo yang disentuh
+        self.sim_tick = 0
+        self.transitions = TimerWheel()
+        self._moving = {}     # id -> entity yang sedang berjalan (mode "full")
+        self._last_anim = {}  # id -> tick terakhir animasi di-update (mode "full")
+        for e in self._ai_entities():
+            self.transitions.schedule(e, 1)
+        self._populate_grid()
+
+    def _ai_entities(self):
+        """Entity berbasis objek yang AI-nya disimulasikan controller"""
+        return self.cats if self.population is not None else self.cats + self.animals
+
+    def _populate_grid(self):
+        """Masukkan semua entity dunia ke spatial grid (yang sudah ada cukup di-update)"""
+        grid = self.spatial_grid
+        grid.insert(self.player, kind="player")
+        for t in self.trees: grid.insert(t, kind="tree")
+        if self.population is None:
+            for a in self.animals: grid.insert(a, kind="animal")
+        for c in self.cats: grid.insert(c, kind="cat")
+        for bt in self.boundary_trees: grid.insert(bt, kind="boundary_tree")
+    
+    def begin_tick(self):
+        """Simpan posisi entity sebelum tick simulasi (untuk interpolasi render)"""
+        movers = [self.player] + self.cats
+        if self.population is None:
+            movers += self.animals
+        elif self.sim_worker is None:
+            self.population.snapshot()  # Mode worker: prev_x/prev_y diisi worker
+        self.interpolator.snapshot(movers)
+    
+    def interpolate(self, alpha):
+        """Pindah sementara entity ke posisi render (alpha 0..1 di antara dua tick)"""
+        self.interpolator.apply(alpha)
+        if self.population is not None:
+            self.population.interpolate(alpha)
+    
+    def end_interpolation(self):
+        """Kembalikan posisi simulasi setelah render"""
+        self.interpolator.restore()
+        if self.population is not None:
+            self.population.end_interpolation()
     
-    def handle_input(self, popup_active):
-        """Handle input dari keyboard"""
-        keys = pygame.key.get_pressed()
+    def handle_input(self, popup_active, move=None):
+        """Handle input dari keyboard, atau arah `move` (dx, dy) dari skrip"""
         dx, dy = 0, 0
         if not popup_active:
-            if keys[pygame.K_LEFT] or keys[pygame.K_a]: dx = -1
-            if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx = 1
-            if keys[pygame.K_UP] or keys[pygame.K_w]: dy = -1
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]: dy = 1
+            if move is not None:
+                dx, dy = move
+            else:
+                keys = pygame.key.get_pressed()
+                if keys[pygame.K_LEFT] or keys[pygame.K_a]: dx = -1
+                if keys[pygame.K_RIGHT] or keys[pygame.K_d]: dx = 1
+                if keys[pygame.K_UP] or keys[pygame.K_w]: dy = -1
+                if keys[pygame.K_DOWN] or keys[pygame.K_s]: dy = 1
             self.player.move(dx, dy)
+            self.spatial_grid.update(self.player)
     
     def update_camera(self, screen_width, screen_height):
         """Update posisi kamera mengikuti player"""
@@ -34,15 +103,18 @@ class GameController:
     
     def update_interactions(self):
         """Update highlight dan deteksi interaksi"""
+        # Reset highlight (cukup objek yang terakhir di-highlight)
+        if self.can_interact_with:
+            self.can_interact_with.highlight = False
         self.can_interact_with = None
         min_dist = float('inf')
         
-        # Reset highlight
-        for obj in self.trees + self.animals + self.cats:
-            obj.highlight = False
-        
-        # Cari objek terdekat
-        for obj in self.trees + self.animals + self.cats: 
+        # Cari objek terdekat lewat spatial grid, bukan seluruh dunia
+        px, py = self.player.rect.center
+        nearby = self.spatial_grid.query_radius(px, py, INTERACTION_DISTANCE, INTERACTABLE_KINDS)
+        if self.population is not None:
+            nearby += self.population.query_radius(px, py, INTERACTION_DISTANCE)
+        for obj in nearby: 
             dist = calculate_distance(self.player.rect, obj.rect)
             if dist < INTERACTION_DISTANCE and dist < min_dist:
                 min_dist = dist
@@ -52,16 +124,70 @@ class GameController:
             self.can_interact_with.highlight = True
     
     def update_cats(self, popup_active):
-        """Update animasi kucing dan hewan"""
-        if not popup_active: 
-            for cat_obj in self.cats:
-                cat_obj.update()
-            for animal_obj in self.animals:
-                animal_obj.update()
+        """Update AI & animasi kucing dan hewan (satu tick simulasi)"""
+        if popup_active:
+            return
+        self.sim_tick += 1
+        now = self.sim_tick
+        grid = self.spatial_grid
+        scheduler = self.scheduler
+        
+        # Transisi state yang jatuh tempo tick ini saja
+        due = self.transitions.pop_due(now)
+        for e in due:
+            if scheduler is not None:
+                scheduler.catch_up(e, now, grid)
+            e.roll_next_state()
+            self.transitions.schedule(e, now + e.transition_ticks())
+            if scheduler is None and e.state in MOVING_STATES:
+                self._moving[id(e)] = e  # Hanya dipakai (dan dikosongkan) _update_full
+        frame_profiler.count("transitions", len(due))
+        
+        if scheduler is not None:
+            # LOD / budget: tidak semua entity di-update penuh tiap tick
+            scheduler.update(self._ai_entities(), self.camera, grid, now)
+        else:
+            self._update_full(now)
+        if self.sim_worker is not None:
+            self.sim_worker.pending += 1  # Dijalankan worker di sync_simulation()
+        elif self.population is not None:
+            # Semua hewan dimajukan sekaligus (vectorized)
+            self.population.update()
+    
+    def sync_simulation(self):
+        """Mode worker: ambil hasil batch tick sebelumnya & mulai batch berikutnya (sekali per frame)"""
+        if self.sim_worker is not None:
+            with frame_profiler.section("sim_sync"):
+                self.sim_worker.sync()
+    
+    def close(self):
+        """Hentikan worker simulasi (jika ada)"""
+        if self.sim_worker is not None:
+            self.sim_worker.close()
+            self.sim_worker = None
+    
+    def _update_full(self, now):
+        """Gerakkan semua entity yang sedang berjalan; animasi hanya yang terlihat kamera"""
+        grid = self.spatial_grid
+        moving = self._moving
+        for key, e in list(moving.items()):
+            e.update_movement()
+            grid.update(e)
+            if e.state not in MOVING_STATES:
+                del moving[key]
+        last_anim = self._last_anim
+        for e in grid.query_rect(self.camera, LOD_KINDS):
+            key = id(e)
+            e.update_animation(now - last_anim.get(key, now - 1))
+            last_anim[key] = now
     
     def handle_event(self, event):
         """Handle event pygame"""
         if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_F3:
+                frame_profiler.toggle_overlay()
+                return
+            
             if event.key == pygame.K_ESCAPE or event.key == pygame.K_SPACE:
                 if self.popup: 
                     self.popup = None
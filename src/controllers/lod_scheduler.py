@@ -0,0 +1,73 @@
+from src.config import LOD_NEAR_MARGIN, LOD_FAR_INTERVAL
+from src.utils.profiler import frame_profiler
+from src.models.animal import MOVING_STATES
+
+LOD_KINDS = ("animal", "cat")
+
+
+class LodScheduler:
+    """Jadwal update entity berdasarkan jarak ke kamera.
+
+    Entity di dalam kamera (diperbesar `near_margin`) di-update penuh tiap
+    tick: gerak + animasi. Entity jauh dibagi ke `far_interval` kelompok dan
+    tiap tick hanya satu kelompok yang digerakkan secara kasar (semua tick
+    yang terlewat sekaligus, tanpa animasi). Saat entity masuk area dekat,
+    tick gerak dan animasi yang tertunda dikejar dalam satu update, jadi
+    biaya per tick sebanding jumlah entity yang terlihat + total / interval.
+    Entity jauh yang diam (idle/tidur) tidak perlu digerakkan sama sekali.
+    """
+
+    def __init__(self, near_margin=LOD_NEAR_MARGIN, far_interval=LOD_FAR_INTERVAL):
+        self.near_margin = near_margin
+        self.far_interval = max(1, far_interval)
+        self._entities = None
+        self._groups = []
+        self._last_move = {}  # id(entity) -> tick terakhir gerak di-update
+        self._last_anim = {}  # id(entity) -> tick terakhir animasi di-update
+
+    def _assign(self, entities, now):
+        self._entities = list(entities)
+        n = self.far_interval
+        self._groups = [self._entities[i::n] for i in range(n)]
+        for e in self._entities:
+            self._last_move.setdefault(id(e), now - 1)
+            self._last_anim.setdefault(id(e), now - 1)
+
+    def catch_up(self, e, now, grid):
+        """Kejar gerak tertunda sampai sebelum tick `now` (dipanggil sebelum transisi state)"""
+        key = id(e)
+        pending = now - 1 - self._last_move.get(key, now - 1)
+        if pending > 0:
+            e.update_movement(pending)
+            self._last_move[key] = now - 1
+            grid.update(e)
+
+    def update(self, entities, camera, grid, now):
+        """Tick simulasi `now` untuk `entities` (semuanya terdaftar di `grid`)"""
+        if self._entities is None or len(entities) != len(self._entities):
+            self._assign(entities, now)
+        last_move, last_anim = self._last_move, self._last_anim
+
+        near = grid.query_rect(camera.inflate(self.near_margin * 2, self.near_margin * 2), LOD_KINDS)
+        for e in near:
+            key = id(e)
+            e.update_movement(now - last_move[key])
+            e.update_animation(now - last_anim[key])
+            last_move[key] = last_anim[key] = now
+            grid.update(e)
+
+        far = 0
+        for e in self._groups[now % self.far_interval]:
+            key = id(e)
+            if last_move[key] == now:
+                continue
+            if e.state not in MOVING_STATES:
+                last_move[key] = now
+                continue
+            e.update_movement(now - last_move[key])
+            last_move[key] = now
+            grid.update(e)
+            far += 1
+
+        frame_profiler.count("lod_near", len(near))
+        frame_profiler.count("lod_far", far)
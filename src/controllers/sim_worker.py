@@ -0,0 +1,74 @@
+import threading
+
+
+class SimulationWorker:
+    """Simulasi Population di worker thread dengan state double-buffered.
+
+    `front` adalah Population yang dibaca main thread (render, interaksi,
+    minimap); `back` adalah salinannya yang hanya dimajukan worker. Tick
+    yang dikumpulkan selama satu frame dijalankan worker sambil main thread
+    me-render hasil batch sebelumnya; di awal frame berikutnya `sync()`
+    menunggu batch itu selesai lalu menyalin hasilnya ke `front`. Karena
+    salinan hanya terjadi di titik sync, render membaca `front` tanpa lock.
+    Hewan tampil tertinggal satu batch tick, sedangkan hasil simulasinya
+    sama persis dengan mode tanpa thread (urutan tick & rng yang sama).
+    """
+
+    def __init__(self, population):
+        self.front = population
+        self.back = population.clone()  # Dibuat setelah semua hewan di-spawn
+        self.pending = 0       # Tick yang menunggu batch berikutnya
+        self._batch = 0
+        self._published = True  # Hasil batch terakhir sudah disalin ke front
+        self._closed = False
+        self._error = None  # Exception dari worker, di-raise ulang di sync()
+        self._wake = threading.Event()
+        self._done = threading.Event()
+        self._done.set()
+        self._thread = threading.Thread(target=self._run, name="population-sim", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        back = self.back
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            try:
+                for _ in range(self._batch):
+                    back.snapshot()  # prev_x/prev_y untuk interpolasi render
+                    back.update()
+            except BaseException as e:
+                self._error = e
+                return
+            finally:
+                # Selalu dilepas supaya sync()/close() tidak menunggu selamanya
+                self._done.set()
+
+    def sync(self):
+        """Tunggu batch yang berjalan, salin hasilnya ke front, lalu mulai tick yang tertunda"""
+        self._done.wait()
+        if self._error is not None:
+            error, self._error = self._error, None
+            self._closed = True  # Thread worker sudah berhenti
+            self._published = True  # Batch yang gagal tidak disalin ke front
+            raise error
+        if not self._published:
+            self.front.copy_render_state(self.back)
+            self._published = True
+        if self.pending and not self._closed:
+            self._batch, self.pending = self.pending, 0
+            self._published = False
+            self._done.clear()
+            self._wake.set()
+
+    def close(self):
+        """Hentikan worker (batch yang sedang berjalan diselesaikan dulu)"""
+        self._done.wait()
+        self._closed = True
+        self._wake.set()
+        self._thread.join()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
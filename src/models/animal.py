@@ -1,157 +1,137 @@
 import pygame
 import random
 import math
-from src.config import YELLOW, MAP_RECT, MAP_WIDTH, MAP_HEIGHT
-from src.utils.asset_loader import get_asset_path
+from src.config import YELLOW, MAP_RECT, MAP_WIDTH, MAP_HEIGHT, TICK_SCALE
+from src.models.species import get_species
+from src.models.behaviour import STATES, STATE_IDS
+
+MOVING_STATES = ("walking", "running")
 
 class Animal:
-    def __init__(self, x, y, animal_type, name, desc):
+    """Hewan berbasis tabel spesies (lihat src/models/species.py).
+
+    Semua frame, frame cermin dan aturan perilaku milik `Species` yang
+    dipakai bersama; instance hanya menyimpan posisi dan state AI-nya.
+    Transisi state tidak dihitung tiap tick: pemanggil (GameController)
+    menjadwalkan `roll_next_state()` pada tick ke-`transition_ticks()`.
+    """
+
+    def __init__(self, x, y, animal_type, name, desc, rng=None):
         self.animal_type = animal_type
         self.name = name
         self.description = desc
         self.type = "animal"
         self.highlight = False
 
-        # Load spritesheet animasi
-        self.all_frames = []
-        full_path = get_asset_path("assets", "animals_move", f"{animal_type}.png")
-        
-        try:
-            sprite_sheet = pygame.image.load(full_path).convert_alpha()
-            sheet_w, sheet_h = sprite_sheet.get_size()
-            
-            # Spritesheet layout: 8 kolom x 4 baris
-            cols = 8
-            rows = 4
-            frame_w = sheet_w // cols
-            frame_h = sheet_h // rows
-            
-            SCALE_FACTOR = 0.5  # Adjust sesuai kebutuhan
-            target_w = int(frame_w * SCALE_FACTOR)
-            target_h = int(frame_h * SCALE_FACTOR)
-            
-            for row in range(rows):
-                for col in range(cols):
-                    rect = pygame.Rect(col * frame_w, row * frame_h, frame_w, frame_h)
-                    image_big = sprite_sheet.subsurface(rect)
-                    image_small = pygame.transform.scale(image_big, (target_w, target_h))
-                    self.all_frames.append(image_small)
-                    
-        except Exception as e:
-            print(f"[ERROR] Gagal load {animal_type}: {e}")
-            dummy = pygame.Surface((40, 40))
-            dummy.fill((200, 100, 50))
-            self.all_frames = [dummy] * 32
-
-        def get_frames(start, count):
-            safe_count = min(count, len(self.all_frames) - start)
-            if safe_count <= 0: return [self.all_frames[0]]
-            return self.all_frames[start : start + safe_count]
-
-        # Animation frames (sesuaikan dengan layout spritesheet)
-        self.idle_frames = get_frames(0, 8)
-        self.walk_frames = get_frames(8, 8)
-        self.run_frames = get_frames(16, 8) if len(self.all_frames) >= 24 else self.walk_frames
-        self.sleep_frames = get_frames(24, 4) if len(self.all_frames) >= 28 else self.idle_frames
-
-        self.current_animation = self.idle_frames
-        self.frame_index = 0
-        self.animation_speed = 0.12
-        
-        if self.current_animation:
-            self.image = self.current_animation[0]
-        else:
-            self.image = pygame.Surface((40, 40))
-            
-        self.rect = self.image.get_rect(center=(x, y))
-        
-        # AI behavior
-        self.speed = random.uniform(0.3, 1.0)
+        self.species = get_species(animal_type)
+
+        # Posisi float supaya kecepatan < 1 pixel per frame tetap bergerak
+        self.true_x = float(x)
+        self.true_y = float(y)
+
+        # AI behavior (rng: stream AI milik hewan ini, default modul random global)
+        self.rng = rng if rng is not None else random
+        self.speed = self.rng.uniform(*self.species.speed_range) * TICK_SCALE
         self.state = "idle"
-        self.move_timer = 0
-        self.move_duration = 0
+        self.move_duration = 0  # Durasi state sekarang (tick 60 Hz)
         self.target_pos = (x, y)
         self.facing_right = True
+        self.direction = "down"
+
+        self.current_animation = None
+        self.mirrored_animation = None
+        self.frame_index = 0
+        self.animation_speed = 0
+        self._apply_state_animation()
+        self.image = self.current_animation[0]
+        self.rect = self.image.get_rect(center=(x, y))
 
-    def set_animation(self, animation_frames, animation_speed=0.12):
-        if self.current_animation != animation_frames and len(animation_frames) > 0:
-            self.current_animation = animation_frames
+    def set_animation(self, frames, mirrored, animation_speed):
+        if self.current_animation is not frames:
+            self.current_animation = frames
+            self.mirrored_animation = mirrored
             self.frame_index = 0
-            self.animation_speed = animation_speed
+            self.animation_speed = animation_speed * TICK_SCALE
 
-    def update_animation(self):
-        if not self.current_animation: 
-            return
+    def _apply_state_animation(self):
+        frames, mirrored, rate = self.species.state_animations[self.state][self.direction]
+        self.set_animation(frames, mirrored, rate)
+
+    def update_animation(self, ticks=1):
+        frames = self.current_animation
+        self.frame_index += self.animation_speed * ticks
+        if self.frame_index >= len(frames):
+            # Mengejar beberapa tick sekaligus (LOD): fase animasi tetap berlanjut
+            self.frame_index = 0 if ticks == 1 else self.frame_index % len(frames)
 
-        self.frame_index += self.animation_speed
-        if self.frame_index >= len(self.current_animation):
-            self.frame_index = 0
-        
         idx = int(self.frame_index)
-        if idx < len(self.current_animation):
-            current_frame_image = self.current_animation[idx]
-            if not self.facing_right:
-                self.image = pygame.transform.flip(current_frame_image, True, False)
+        self.image = frames[idx] if self.facing_right else self.mirrored_animation[idx]
+
+    def transition_ticks(self):
+        """Jumlah tick simulasi sampai transisi state berikutnya"""
+        return max(1, math.ceil(self.move_duration / TICK_SCALE))
+
+    def roll_next_state(self):
+        """Pilih state berikutnya dari tabel transisi spesies"""
+        species = self.species
+        rng = self.rng
+        state, self.move_duration, speed = species.behaviour.roll(STATE_IDS[self.state], rng)
+        self.state = STATES[state]
+        if speed is not None:
+            self.speed = speed * TICK_SCALE
+
+        if self.state in MOVING_STATES:
+            cx, cy = int(self.true_x), int(self.true_y)
+            r = species.wander
+            self.target_pos = (
+                rng.randint(max(0, cx - r), min(MAP_WIDTH, cx + r)),
+                rng.randint(max(0, cy - r), min(MAP_HEIGHT, cy + r))
+            )
+
+        self._apply_state_animation()
+
+    def update_movement(self, ticks=1):
+        """Maju `ticks` tick sekaligus (>1 untuk update kasar entity jauh dari kamera)"""
+        if self.state in MOVING_STATES:
+            dx = self.target_pos[0] - self.true_x
+            dy = self.target_pos[1] - self.true_y
+            dist = math.hypot(dx, dy)
+
+            if abs(dx) > abs(dy):
+                self.direction = "right" if dx > 0 else "left"
             else:
-                self.image = current_frame_image
-
-    def update_movement(self):
-        self.move_timer -= 1
-        if self.move_timer <= 0:
-            rand_val = random.random()
-            if self.state == "idle":
-                if rand_val < 0.6:  # Walking
-                    self.state = "walking"
-                    self.move_duration = random.randint(80, 200)
-                    self.speed = random.uniform(0.5, 1.2)
-                else:  # Stay idle or sleep
-                    self.state = random.choice(["idle", "sleeping"])
-                    self.move_duration = random.randint(100, 250)
-            elif self.state == "walking":
-                self.state = random.choice(["idle", "sleeping"])
-                self.move_duration = random.randint(100, 250)
-            elif self.state == "sleeping":
-                self.state = "idle"
-                self.move_duration = random.randint(60, 120)
-
-            if self.state == "walking":
-                self.target_pos = (
-                    random.randint(max(0, self.rect.centerx - 150), min(MAP_WIDTH, self.rect.centerx + 150)),
-                    random.randint(max(0, self.rect.centery - 150), min(MAP_HEIGHT, self.rect.centery + 150))
-                )
-            
-            self.move_timer = self.move_duration
-
-        if self.state == "walking":
-            self.set_animation(self.walk_frames, animation_speed=0.15)
-            
-            dx = self.target_pos[0] - self.rect.centerx
-            dy = self.target_pos[1] - self.rect.centery
-            dist = math.sqrt(dx**2 + dy**2)
-            
-            if dist > self.speed:
-                self.rect.x += (dx / dist) * self.speed
-                self.rect.y += (dy / dist) * self.speed
-                if dx < 0: 
-                    self.facing_right = False
-                elif dx > 0: 
-                    self.facing_right = True
+                self.direction = "down" if dy > 0 else "up"
+            if dx < 0:
+                self.facing_right = False
+            elif dx > 0:
+                self.facing_right = True
+
+            step = self.speed * ticks
+            if dist > step:
+                self.true_x += (dx / dist) * step
+                self.true_y += (dy / dist) * step
+                rect = self.rect
+                rect.center = (int(self.true_x), int(self.true_y))
+                if not MAP_RECT.contains(rect):
+                    rect.clamp_ip(MAP_RECT)
+                    self.true_x, self.true_y = rect.center
             else:
+                if ticks > 1:
+                    # Update kasar: sisa jarak pasti tertempuh dalam `ticks` tick
+                    self.true_x, self.true_y = map(float, self.target_pos)
+                    self.rect.center = self.target_pos
+                    self.rect.clamp_ip(MAP_RECT)
                 self.state = "idle"
-            self.rect.clamp_ip(MAP_RECT)
 
-        elif self.state == "idle":
-            self.set_animation(self.idle_frames)
-            
-        elif self.state == "sleeping":
-            self.set_animation(self.sleep_frames, animation_speed=0.05)
+        self._apply_state_animation()
 
-    def update(self):
-        self.update_movement()
-        self.update_animation()
+    def update(self, ticks=1):
+        self.update_movement(ticks)
+        self.update_animation(ticks)
 
     def draw(self, surface, camera):
         screen_rect = self.rect.move(-camera.x, -camera.y)
         if self.highlight:
-            pygame.draw.circle(surface, YELLOW, screen_rect.center, 35, 3)
+            radius, width, offset = self.species.highlight
+            pygame.draw.circle(surface, YELLOW, (screen_rect.centerx, screen_rect.centery + offset), radius, width)
         surface.blit(self.image, screen_rect)
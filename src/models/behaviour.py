@@ -0,0 +1,79 @@
+from bisect import bisect_right
+
+STATES = ("idle", "walking", "running", "sleeping")
+STATE_IDS = {state: i for i, state in enumerate(STATES)}
+IDLE, WALKING, RUNNING, SLEEPING = range(len(STATES))
+
+
+def _legacy_transitions(behaviour):
+    """Format lama (idle / idle_else / move_end / sleep_end) -> tabel transisi"""
+    def split(choices, duration, remaining):
+        return [(remaining / len(choices), state, duration, None) for state in choices]
+
+    idle = list(behaviour["idle"])
+    rest = 1.0 - sum(chance for chance, _, _, _ in idle)
+    move_end = split(*behaviour["move_end"], 1.0)
+    return {
+        "idle": idle + split(*behaviour["idle_else"], rest),
+        "walking": move_end,
+        "running": move_end,
+        "sleeping": split(*behaviour["sleep_end"], 1.0),
+    }
+
+
+class BehaviourTable:
+    """Tabel transisi state yang sudah dikompilasi ke array datar.
+
+    Untuk tiap state (indeks di `STATES`) ada baris-baris transisi: peluang
+    kumulatif, state tujuan, rentang durasi (tick 60 Hz) dan rentang
+    kecepatan (NaN = kecepatan tidak berubah). Semua baris disimpan
+    row-major dengan lebar tetap `width`, jadi bisa dipakai langsung oleh
+    `roll()` (satu objek) maupun di-copy ke array NumPy (Population).
+    """
+
+    def __init__(self, transitions, wander):
+        self.wander = wander
+        rows = {STATE_IDS[state]: list(entries) for state, entries in transitions.items()}
+        self.width = max(len(entries) for entries in rows.values())
+        size = len(STATES) * self.width
+        self.cum = [2.0] * size  # Baris kosong tidak pernah terpilih
+        self.next_state = [IDLE] * size
+        self.dur_lo = [1] * size
+        self.dur_hi = [1] * size
+        self.spd_lo = [float("nan")] * size
+        self.spd_hi = [float("nan")] * size
+        self.count = [1] * len(STATES)
+        for state in range(len(STATES)):
+            entries = rows.get(state) or rows[IDLE]
+            self.count[state] = len(entries)
+            cum = 0.0
+            for k, (chance, target, (lo, hi), speed) in enumerate(entries):
+                cum += chance
+                i = state * self.width + k
+                self.cum[i] = cum
+                self.next_state[i] = STATE_IDS[target]
+                self.dur_lo[i], self.dur_hi[i] = lo, hi
+                if speed:
+                    self.spd_lo[i], self.spd_hi[i] = speed
+        # Peluang kumulatif per state untuk bisect
+        self._cum_rows = [self.cum[s * self.width:s * self.width + self.count[s]] for s in range(len(STATES))]
+
+    def roll(self, state, rng):
+        """(state berikutnya, durasi, kecepatan atau None) dari state `state`"""
+        k = min(bisect_right(self._cum_rows[state], rng.random()), self.count[state] - 1)
+        i = state * self.width + k
+        duration = rng.randint(self.dur_lo[i], self.dur_hi[i])
+        lo = self.spd_lo[i]
+        speed = rng.uniform(lo, self.spd_hi[i]) if lo == lo else None  # NaN != NaN
+        return self.next_state[i], duration, speed
+
+
+def compile_behaviour(behaviour):
+    """Kompilasi `behaviour` dari tabel spesies ke `BehaviourTable`.
+
+    Format umum: {"transitions": {state: [(peluang, state tujuan, durasi, kecepatan)]},
+    "wander": radius}. Format lama (idle / idle_else / move_end / sleep_end)
+    dikonversi dulu ke format umum.
+    """
+    transitions = behaviour.get("transitions") or _legacy_transitions(behaviour)
+    return BehaviourTable(transitions, behaviour["wander"])
@@ -1,40 +1,112 @@
-import pygame
 import cairo
+import pygame
 import random
 import math
-from src.config import GRASS_COLORS, MAP_WIDTH, MAP_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+from bisect import bisect_right
+from src.config import GRASS_COLORS, GRASS_SWAY_BEND, MAP_WIDTH, MAP_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT
+from src.utils.sprite_cache import sprite_disk_cache, surface_from_buffer, code_hash
+from src.utils.profiler import startup_profiler
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, fallback ke loop Python biasa
+    np = None
+
+# Naikkan jika tampilan rumput diubah tanpa mengubah kode generatornya
+GRASS_SPRITE_VERSION = 1
+
+# Langkah grid origin entry blit GrassField (piksel). Surface render perlu margin
+# kiri & atas sebesar ini + padding clump supaya entry bisa di-blit tanpa digeser
+GRASS_ORIGIN_STEP = 512
+GRASS_CANVAS_MARGIN = GRASS_ORIGIN_STEP + 64
+
+def _random_grass_blades(width, height, rng=random):
+    """Parameter acak tiap helai rumput dalam satu clump"""
+    blades = []
+    num_blades = rng.randint(7, 12) 
+    for i in range(num_blades):
+        color = rng.choice(GRASS_COLORS)
+        if i < num_blades // 2: color = (color[0]*0.7, color[1]*0.7, color[2]*0.7) 
+        base_x = width/2 + rng.uniform(-width*0.4, width*0.4)
+        tip_x = base_x + rng.uniform(-width*0.2, width*0.2)
+        tip_y = rng.uniform(height*0.1, height*0.4) 
+        stiffness = rng.uniform(0.7, 1.3)
+        blades.append((color, base_x, tip_x, tip_y, stiffness))
+    return blades
+
+def _rasterize_grass_clump(width, height, blades, bend=0.0, pad=0):
+    """Rasterisasi helai rumput; `bend` menggeser ujung helai (piksel) secara kuadratik.
 
-def create_grass_clump_sprite(width, height):
-    """Membuat sprite rumput menggunakan PyCairo"""
-    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, width, height)
+    Returns:
+        (width, height, format, buffer pixel)
+    """
+    surf_w = width + pad * 2
+    surface = cairo.ImageSurface(cairo.FORMAT_ARGB32, surf_w, height)
     ctx = cairo.Context(surface)
     ctx.set_source_rgba(0, 0, 0, 0)
     ctx.paint()
-    num_blades = random.randint(7, 12) 
-    for i in range(num_blades):
-        color = random.choice(GRASS_COLORS)
-        if i < num_blades // 2: color = (color[0]*0.7, color[1]*0.7, color[2]*0.7) 
+    for color, base_x, tip_x, tip_y, stiffness in blades:
         ctx.set_source_rgb(color[0]/255, color[1]/255, color[2]/255)
-        base_x = width/2 + random.uniform(-width*0.4, width*0.4)
+        base_x += pad
+        tip_x += pad
         base_y = height 
-        tip_x = base_x + random.uniform(-width*0.2, width*0.2)
-        tip_y = random.uniform(height*0.1, height*0.4) 
+        # Lengkungan: pergeseran sebanding kuadrat tinggi titik dari pangkal
+        b = bend * stiffness
+        tip_f = (height - tip_y) / height
         ctx.move_to(base_x - 2, base_y) 
-        ctx.curve_to(base_x, height*0.7, tip_x, height*0.3, tip_x, tip_y) 
+        ctx.curve_to(base_x + b*0.09, height*0.7, tip_x + b*0.49, height*0.3, tip_x + b*tip_f*tip_f, tip_y) 
         ctx.line_to(base_x + 2, base_y) 
         ctx.close_path(); ctx.fill()
-    buf = surface.get_data()
-    return pygame.image.frombuffer(buf, (width, height), 'ARGB')
+    surface.flush()
+    return surf_w, height, 'ARGB', surface.get_data()
+
+def _render_grass_clump(width, height, blades, bend=0.0, pad=0):
+    return surface_from_buffer(*_rasterize_grass_clump(width, height, blades, bend, pad))
 
-def spawn_all_grass_clumps(total_clumps, sprite_cache):
+def _cached_grass_clump(width, height, seed, bend=0.0, pad=0):
+    """Clump deterministik dari `seed`, dimuat dari cache disk jika sudah pernah di-rasterize"""
+    def rasterize():
+        with startup_profiler.measure("procedural", f"grass_clump {width}x{height}"):
+            blades = _random_grass_blades(width, height, random.Random(seed))
+            return _rasterize_grass_clump(width, height, blades, bend, pad)
+    # Konstanta config yang dibaca generator ikut di key (palet berubah -> entry baru)
+    params = {"width": width, "height": height, "seed": seed, "bend": round(bend, 6), "pad": pad,
+              "colors": GRASS_COLORS}
+    code = code_hash(_random_grass_blades, _rasterize_grass_clump)
+    return surface_from_buffer(*sprite_disk_cache.get_buffer("grass_clump", GRASS_SPRITE_VERSION, code, params, rasterize))
+
+def create_grass_clump_sprite(width, height, seed=None):
+    """Membuat sprite rumput menggunakan PyCairo
+
+    Dengan `seed`, helai rumput deterministik dan hasilnya disimpan di cache disk.
+    """
+    if seed is not None:
+        return _cached_grass_clump(width, height, seed)
+    return _render_grass_clump(width, height, _random_grass_blades(width, height))
+
+def create_grass_clump_frames(width, height, phases, max_bend=GRASS_SWAY_BEND, seed=None):
+    """Membuat `phases` frame goyangan satu clump (helai benar-benar melengkung).
+
+    Frame ke-k memakai lengkungan sin(2*pi*k/phases) * max_bend. Semua frame
+    berukuran sama (diberi padding kiri-kanan) dan frame 0 adalah posisi tegak.
+    Dengan `seed`, frame dimuat dari / disimpan ke cache disk.
+    """
+    pad = int(math.ceil(max_bend))
+    bends = [math.sin(2 * math.pi * k / phases) * max_bend for k in range(phases)]
+    if seed is not None:
+        return [_cached_grass_clump(width, height, seed, bend, pad) for bend in bends]
+    blades = _random_grass_blades(width, height)
+    return [_render_grass_clump(width, height, blades, bend, pad) for bend in bends]
+
+def spawn_all_grass_clumps(total_clumps, sprite_cache, rng=random):
     """Menyebar gumpalan rumput di seluruh map"""
     clumps = []
     for _ in range(total_clumps):
         clumps.append({
-            "x": random.randint(0, MAP_WIDTH),
-            "y": random.randint(0, MAP_HEIGHT),
-            "sprite": random.choice(sprite_cache),
-            "amp": random.randint(3, 8), "spd": random.uniform(0.5, 1.5), "off": random.uniform(0, 6.28)
+            "x": rng.randint(0, MAP_WIDTH),
+            "y": rng.randint(0, MAP_HEIGHT),
+            "sprite": rng.choice(sprite_cache),
+            "amp": rng.randint(3, 8), "spd": rng.uniform(0.5, 1.5), "off": rng.uniform(0, 6.28)
         })
     return clumps
 
@@ -45,3 +117,307 @@ def draw_swaying_clump(surface, clump, time_sec, camera):
     sy = clump["y"] - camera.y - clump["sprite"].get_height()
     if -50 < sx < SCREEN_WIDTH and -50 < sy < SCREEN_HEIGHT:
         surface.blit(clump["sprite"], (sx, sy))
+
+
+class GrassField:
+    """Semua rumput dalam bentuk kolom (x, y, amp, spd, off, sprite id).
+
+    Clump diurutkan berdasarkan y sekali saat dibuat, jadi indeks yang terlihat
+    sudah dalam urutan kedalaman. Dengan NumPy, goyangan dan mask layar dihitung
+    dalam satu pass vectorized; hasilnya digambar lewat `Surface.blits`.
+
+    Jika `sway_frames` diberikan (list frame dari `create_grass_clump_frames`,
+    frame 0 = sprite di clump), goyangan tidak lagi berupa translasi: tiap clump
+    cukup memilih indeks fase dari jam global dan `amp` diabaikan.
+    """
+
+    def __init__(self, clumps, sway_frames=None):
+        clumps = sorted(clumps, key=lambda c: c["y"])
+        self.sprites = []
+        sprite_ids = {}
+        sid = []
+        for c in clumps:
+            key = id(c["sprite"])
+            if key not in sprite_ids:
+                sprite_ids[key] = len(self.sprites)
+                self.sprites.append(c["sprite"])
+            sid.append(sprite_ids[key])
+
+        columns = {
+            "x": [c["x"] for c in clumps],
+            "y": [c["y"] for c in clumps],
+            "amp": [c["amp"] for c in clumps],
+            "spd": [c["spd"] for c in clumps],
+            "off": [c["off"] for c in clumps],
+        }
+        half_w = [self.sprites[i].get_width() / 2 for i in sid]
+
+        # Atlas fase goyangan per sprite (baris = sprite id, kolom = fase)
+        atlas_rows = None
+        self.phases = 0
+        if sway_frames:
+            frames_of = {id(frames[0]): frames for frames in sway_frames}
+            atlas_rows = [frames_of.get(id(sprite), [sprite]) for sprite in self.sprites]
+            self.phases = max(len(frames) for frames in atlas_rows)
+            # Sprite tanpa atlas cukup diulang di semua fase
+            atlas_rows = [frames * (self.phases // len(frames)) if len(frames) != self.phases else frames
+                          for frames in atlas_rows]
+        self._phase_scale = self.phases / (2 * math.pi)
+        heights = [self.sprites[i].get_height() for i in sid]
+
+        if np is not None:
+            for name, values in columns.items():
+                setattr(self, name, np.asarray(values, dtype=np.float64))
+            self.sid = np.asarray(sid, dtype=np.int32)
+            self.half_w = np.asarray(half_w, dtype=np.float64)
+            self.h = np.asarray(heights, dtype=np.float64)
+            self._sprite_of = np.empty(len(sid), dtype=object)
+            self._sprite_of[:] = [self.sprites[i] for i in sid]
+            if atlas_rows:
+                self.atlas = np.empty((len(atlas_rows), self.phases), dtype=object)
+                for row, frames in enumerate(atlas_rows):
+                    self.atlas[row, :] = frames
+            else:
+                self.atlas = None
+        else:
+            for name, values in columns.items():
+                setattr(self, name, values)
+            self.sid = sid
+            self.half_w = half_w
+            self.h = heights
+            self._sprite_of = [self.sprites[i] for i in sid]
+            self.atlas = atlas_rows
+
+        # Entry blit (sprite, posisi) per (clump, kolom goyangan) relatif ke origin
+        # grid `_origin`; dibuat sekali lalu dipakai ulang selama origin sama.
+        # Kolom = offset goyangan dalam piksel (translasi) atau fase atlas
+        if np is not None:
+            self._left = np.floor(self.x - self.half_w).astype(np.int64)
+            self._top = np.floor(self.y - self.h).astype(np.int64)
+            self._amp_max = int(math.ceil(self.amp.max())) if len(self.amp) else 0
+            self._h_max = float(self.h.max()) if len(self.h) else 0.0
+            cols = self.phases if self.atlas is not None else 2 * self._amp_max + 1
+            self._entries = np.empty((len(self.sid), cols), dtype=object)
+            self._built = np.zeros((len(self.sid), cols), dtype=bool)
+            # Ukuran sprite (semua fase atlas sama) & tabel bantu changed_rects()
+            self._width = (2 * self.half_w).astype(np.int64)
+            self._height = self.h.astype(np.int64)
+            self._lookup = np.full(len(self.sid), -1, dtype=np.intp)
+        self._origin = None
+
+        # Hasil prepare() untuk frame berjalan
+        self._blit_seq = []
+        self._depths = []
+        self._visible = []  # indeks clump untuk tiap entry _blit_seq
+        self._shift = None  # posisi layar origin entry; None = entry sudah dalam koordinat layar
+        self._col = self._screen_x = self._screen_y = None  # kolom & posisi layar (NumPy) tiap entry
+        self._boxes = None  # Kotak layar tiap entry, dihitung saat select() pertama
+        self._target_cache = None  # (surface, clip, subsurface target) terakhir
+
+    def __len__(self):
+        return len(self.sid)
+
+    def sprite_positions(self):
+        """(kedalaman, sprite, posisi world kiri-atas) tiap clump tanpa goyangan"""
+        for i in range(len(self)):
+            x, y = float(self.x[i]), float(self.y[i])
+            yield y, self._sprite_of[i], (x - float(self.half_w[i]), y - float(self.h[i]))
+
+    def prepare(self, time_sec, camera):
+        """Hitung posisi layar clump yang terlihat. Mengembalikan jumlahnya"""
+        if np is not None:
+            self._prepare_numpy(time_sec, camera)
+        else:
+            self._prepare_python(time_sec, camera)
+        return len(self._blit_seq)
+
+    def _prepare_numpy(self, time_sec, camera):
+        # Clump terurut y: kandidat cukup satu potongan [lo, hi) dari searchsorted
+        lo = int(np.searchsorted(self.y, camera.y - 50, "left"))
+        hi = int(np.searchsorted(self.y, camera.bottom + self._h_max, "right"))
+        top = self._top[lo:hi] - camera.y
+        left = self._left[lo:hi] - camera.x
+        amp_max = self._amp_max
+        mask = (top > -50) & (top < camera.height) & (left + amp_max > -50) & (left - amp_max < camera.width)
+        rel = np.flatnonzero(mask)
+        idx = rel + lo
+        angle = time_sec * self.spd[idx] + self.off[idx]
+        if self.atlas is not None:
+            # Fase = sudut sin yang dikuantisasi; cukup lookup tabel
+            col = (angle * self._phase_scale).astype(np.intp) % self.phases
+            sx = left[rel]
+        else:
+            offset = np.rint(np.sin(angle) * self.amp[idx]).astype(np.intp)
+            col = offset + amp_max
+            sx = left[rel] + offset
+        keep = (sx > -50) & (sx < camera.width)
+        idx, col = idx[keep], col[keep]
+
+        # Origin entry di-snap ke grid, jadi entry hanya dibuat ulang saat kamera
+        # pindah satu langkah grid, bukan tiap frame
+        step = GRASS_ORIGIN_STEP
+        origin = ((camera.x - 51 - amp_max) // step * step, (camera.y - 51) // step * step)
+        if origin != self._origin:
+            self._origin = origin
+            self._built[:] = False
+        missing = np.flatnonzero(~self._built[idx, col])
+        if len(missing):
+            self._build_entries(idx[missing], col[missing])
+        self._blit_seq = self._entries[idx, col].tolist()
+        self._shift = (origin[0] - camera.x, origin[1] - camera.y)
+        self._depths = self.y[idx].tolist()
+        self._visible = idx
+        self._col = col
+        self._screen_x = sx[keep]
+        self._screen_y = top[rel[keep]]
+        self._boxes = None
+        self._target_cache = None
+
+    def _build_entries(self, idx, col):
+        ox, oy = self._origin
+        if self.atlas is not None:
+            sprites = self.atlas[self.sid[idx], col]
+            xs = self._left[idx] - ox
+        else:
+            sprites = self._sprite_of[idx]
+            xs = self._left[idx] + (col - self._amp_max) - ox
+        entries = self._entries
+        built = zip(sprites.tolist(), zip(xs.tolist(), (self._top[idx] - oy).tolist()))
+        for i, c, entry in zip(idx.tolist(), col.tolist(), built):
+            entries[i, c] = entry
+        self._built[idx, col] = True
+
+    def _prepare_python(self, time_sec, camera):
+        seq = []
+        depths = []
+        visible = []
+        cam_x, cam_y, cam_w, cam_h = camera.x, camera.y, camera.width, camera.height
+        for i in range(len(self.sid)):
+            sy = self.y[i] - cam_y - self.h[i]
+            if not -50 < sy < cam_h:
+                continue
+            angle = time_sec * self.spd[i] + self.off[i]
+            if self.atlas is not None:
+                sx = self.x[i] - cam_x - self.half_w[i]
+                sprite = self.atlas[self.sid[i]][int(angle * self._phase_scale) % self.phases]
+            else:
+                sx = self.x[i] - cam_x - self.half_w[i] + math.sin(angle) * self.amp[i]
+                sprite = self._sprite_of[i]
+            if -50 < sx < cam_w:
+                seq.append((sprite, (sx, sy)))
+                depths.append(self.y[i])
+                visible.append(i)
+        self._blit_seq = seq
+        self._depths = depths
+        self._visible = visible
+        self._shift = None
+
+    def pixel_state(self):
+        """State piksel hasil prepare() terakhir, untuk changed_rects() di frame berikutnya"""
+        if self._shift is None:
+            return {i: (sprite, int(x), int(y)) for i, (sprite, (x, y)) in zip(self._visible, self._blit_seq)}
+        return self._visible, self._col, self._screen_x, self._screen_y
+
+    def changed_rects(self, previous):
+        """Rect layar (posisi lama & baru) clump yang tampilannya berubah sejak `previous`.
+
+        `previous` adalah pixel_state() frame sebelumnya dengan kamera yang sama.
+        """
+        if self._shift is None:
+            return self._changed_rects_python(previous)
+        idx, col, x, y = self.pixel_state()
+        old_idx, old_col, old_x, old_y = previous
+        # Kamera sama: entry (clump, kolom) yang sama = piksel yang sama,
+        # jadi cukup bandingkan kolom lewat lookup per clump
+        lookup = self._lookup
+        lookup[old_idx] = old_col
+        new = np.flatnonzero(lookup[idx] != col)
+        lookup[old_idx] = -1
+        lookup[idx] = col
+        gone = np.flatnonzero(lookup[old_idx] != old_col)
+        lookup[idx] = -1
+        rects = []
+        for i, px, py in ((idx[new], x[new], y[new]), (old_idx[gone], old_x[gone], old_y[gone])):
+            rects += map(pygame.Rect, px.tolist(), py.tolist(), self._width[i].tolist(), self._height[i].tolist())
+        return rects
+
+    def _changed_rects_python(self, previous):
+        rects = []
+        previous = dict(previous)
+        for i, state in self.pixel_state().items():
+            old = previous.pop(i, None)
+            if old != state:
+                sprite, x, y = state
+                rects.append(pygame.Rect((x, y), sprite.get_size()))
+                if old is not None:
+                    rects.append(pygame.Rect((old[1], old[2]), old[0].get_size()))
+        for sprite, x, y in previous.values():
+            rects.append(pygame.Rect((x, y), sprite.get_size()))
+        return rects
+
+    def select(self, rect):
+        """Posisi (di hasil prepare) clump yang beririsan dengan `rect` layar, beserta kedalamannya"""
+        if self._shift is None:
+            positions = [p for p, (sprite, (x, y)) in enumerate(self._blit_seq)
+                         if rect.colliderect((int(x), int(y)), sprite.get_size())]
+            return positions, [self._depths[p] for p in positions]
+        if self._boxes is None:
+            idx = self._visible
+            x, y = self._screen_x, self._screen_y
+            self._boxes = (x, y, x + self._width[idx], y + self._height[idx])
+        left, top, right, bottom = self._boxes
+        hit = np.flatnonzero((left < rect.right) & (right > rect.left) & (top < rect.bottom) & (bottom > rect.top))
+        return hit.tolist(), self.y[self._visible[hit]].tolist()
+
+    def index_before(self, depth, start=0):
+        """Indeks (di hasil prepare) clump pertama dengan y > depth"""
+        return bisect_right(self._depths, depth, start)
+
+    def _target(self, surface):
+        """Subsurface tempat entry bisa di-blit apa adanya (origin entry = (0, 0)).
+
+        Butuh `surface` berupa subsurface dengan margin cukup di parent-nya
+        (lihat GRASS_CANVAS_MARGIN); jika tidak, None.
+        """
+        clip = surface.get_clip()
+        cached = self._target_cache
+        if cached is not None and cached[0] is surface and cached[1] == clip:
+            return cached[2]
+        parent = surface.get_abs_parent()
+        if parent is surface:
+            return None
+        ax, ay = surface.get_abs_offset()
+        tx, ty = ax + self._shift[0], ay + self._shift[1]
+        if tx < 0 or ty < 0:
+            return None
+        pw, ph = parent.get_size()
+        target = parent.subsurface(pygame.Rect(tx, ty, pw - tx, ph - ty))
+        # Clip surface asal (koordinat layar) dipindah ke koordinat target
+        target.set_clip(clip.move(ax - tx, ay - ty))
+        # Dipakai ulang oleh draw_range berikutnya di frame ini (surface & clip sama)
+        self._target_cache = (surface, clip, target)
+        return target
+
+    def _blit(self, surface, seq):
+        if not seq:
+            return
+        if self._shift is None:
+            surface.blits(seq, doreturn=False)
+            return
+        target = self._target(surface)
+        if target is not None:
+            target.blits(seq, doreturn=False)
+            return
+        # Tanpa margin: geser entry ke koordinat layar satu per satu
+        dx, dy = self._shift
+        surface.blits([(sprite, (x + dx, y + dy)) for sprite, (x, y) in seq], doreturn=False)
+
+    def draw_range(self, surface, start, end):
+        """Gambar clump hasil prepare() [start, end) dalam satu panggilan blits"""
+        if end > start:
+            self._blit(surface, self._blit_seq[start:end])
+
+    def draw_positions(self, surface, positions):
+        """Gambar clump hasil prepare() pada `positions` (hasil select())"""
+        seq = self._blit_seq
+        self._blit(surface, [seq[p] for p in positions])
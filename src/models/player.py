@@ -1,6 +1,6 @@
 import pygame
 import os
-from src.config import PLAYER_SPEED, MAP_RECT
+from src.config import PLAYER_SPEED, MAP_RECT, TICK_SCALE
 from src.utils.asset_loader import load_spritesheet_safe
 
 class Player:
@@ -10,13 +10,15 @@ class Player:
             dummy = pygame.Surface((64, 64)); dummy.fill((0, 0, 255)); self.frames = [dummy]
 
         self.frame_index = 0
-        self.animation_speed = 0.18
+        self.animation_speed = 0.18 * TICK_SCALE
         self.direction = "down"
         self.moving = False
         self.anim_start = {"down": 0, "left": 8, "right": 16, "up": 24}
         self.image = self.frames[0]
         self.rect = self.image.get_rect(center=(x, y))
-        self.speed = PLAYER_SPEED
+        # Posisi float: kecepatan per tick tidak selalu bilangan bulat (lihat TICK_SCALE)
+        self.true_x, self.true_y = float(self.rect.x), float(self.rect.y)
+        self.speed = PLAYER_SPEED * TICK_SCALE
 
     def update_animation(self):
         if len(self.frames) <= 1: return
@@ -32,19 +34,22 @@ class Player:
         if idx < len(self.frames):
             self.image = self.frames[idx]
 
-    def update_direction_from_keys(self):
-        keys = pygame.key.get_pressed()
-        if keys[pygame.K_RIGHT] or keys[pygame.K_d]: self.direction = "right"
-        elif keys[pygame.K_LEFT] or keys[pygame.K_a]: self.direction = "left"
-        elif keys[pygame.K_UP] or keys[pygame.K_w]: self.direction = "up"
-        elif keys[pygame.K_DOWN] or keys[pygame.K_s]: self.direction = "down"
+    def update_direction(self, dx, dy):
+        # Arah dari gerakan (bukan langsung dari keyboard) supaya input skrip juga bekerja
+        if dx > 0: self.direction = "right"
+        elif dx < 0: self.direction = "left"
+        elif dy < 0: self.direction = "up"
+        elif dy > 0: self.direction = "down"
 
     def move(self, dx, dy):
-        self.update_direction_from_keys()
+        self.update_direction(dx, dy)
         self.moving = (dx != 0 or dy != 0)
-        self.rect.x += dx * self.speed
-        self.rect.y += dy * self.speed
-        self.rect.clamp_ip(MAP_RECT)
+        self.true_x += dx * self.speed
+        self.true_y += dy * self.speed
+        self.rect.topleft = (round(self.true_x), round(self.true_y))
+        if not MAP_RECT.contains(self.rect):
+            self.rect.clamp_ip(MAP_RECT)
+            self.true_x, self.true_y = float(self.rect.x), float(self.rect.y)
         self.update_animation()
 
     def draw(self, surface, camera):
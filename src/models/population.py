@@ -0,0 +1,351 @@
+import copy
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional; tanpa NumPy pakai backend "object" (Animal biasa)
+    np = None
+
+import pygame
+from src.config import YELLOW, MAP_WIDTH, MAP_HEIGHT, TICK_SCALE
+from src.models.species import get_species, DIRECTIONS
+from src.models.behaviour import STATES, IDLE, WALKING, RUNNING
+_DIR_LEFT, _DIR_RIGHT, _DIR_UP, _DIR_DOWN = range(len(DIRECTIONS))
+
+# Array per hewan (state simulasi lengkap)
+_ARRAYS = ("x", "y", "tx", "ty", "speed", "due", "state", "direction", "facing_right", "species", "anim", "frame",
+           "prev_x", "prev_y")
+# Array yang dibaca render, interaksi & minimap
+_RENDER_ARRAYS = ("x", "y", "prev_x", "prev_y", "state", "facing_right", "anim", "frame")
+
+
+class AnimalView:
+    """Tampilan ringan satu hewan di `Population`.
+
+    Punya atribut yang dipakai controller & view (`rect`, `image`, `name`,
+    `highlight`, `draw`, ...), tapi posisi & state dibaca langsung dari
+    array milik population.
+    """
+
+    __slots__ = ("population", "index", "animal_type", "name", "description", "type", "highlight")
+
+    def __init__(self, population, index, animal_type, name, desc, kind="animal"):
+        self.population = population
+        self.index = index
+        self.animal_type = animal_type
+        self.name = name
+        self.description = desc
+        self.type = kind
+        self.highlight = False
+
+    @property
+    def rect(self):
+        return self.population.rect_of(self.index)
+
+    @property
+    def image(self):
+        return self.population.image_of(self.index)
+
+    @property
+    def state(self):
+        return STATES[self.population.state[self.index]]
+
+    def update(self):
+        pass  # Disimulasikan sekaligus oleh Population.update()
+
+    def draw(self, surface, camera):
+        pop = self.population
+        i = self.index
+        image = pop.image_of(i)
+        w, h = image.get_size()
+        left = int(pop.draw_x[i]) - w // 2 - camera.x
+        top = int(pop.draw_y[i]) - h // 2 - camera.y
+        if self.highlight:
+            radius, width, offset = pop.species_list[pop.species[i]].highlight
+            pygame.draw.circle(surface, YELLOW, (left + w // 2, top + h // 2 + offset), radius, width)
+        surface.blit(image, (left, top))
+
+
+class Population:
+    """Simulasi hewan dalam bentuk structure-of-arrays (NumPy).
+
+    Posisi, target, kecepatan, tick transisi, state, arah dan frame animasi semua
+    hewan (semua spesies) disimpan sebagai array, dan satu `update()`
+    memajukan semuanya dengan beberapa operasi vektor. Aturan perilakunya
+    sama dengan `Animal` (tabel `behaviour` di species.py), dikompilasi ke
+    tabel transisi per (spesies, state).
+    """
+
+    def __init__(self, capacity=64, rng=None):
+        if np is None:
+            raise RuntimeError("Population membutuhkan NumPy")
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.count = 0
+        self.tick = 0
+        self.views = []
+        self.species_list = []   # id spesies -> Species
+        self._species_ids = {}   # nama -> id spesies
+        self._anim_frames = []   # id animasi -> (frames, frames cermin)
+        self._anim_len = []
+        self._anim_rate = []
+        self._species_anims = []  # per spesies: [state][arah] -> id animasi
+        self._species_half = []   # per spesies: (setengah lebar, setengah tinggi) frame
+        self._alloc(capacity)
+        self._build_tables()
+
+    def __len__(self):
+        return self.count
+
+    def _alloc(self, capacity):
+        self.capacity = capacity
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.tx = np.zeros(capacity)
+        self.ty = np.zeros(capacity)
+        self.speed = np.zeros(capacity)
+        self.due = np.zeros(capacity, dtype=np.int64)  # Tick simulasi transisi state berikutnya
+        self.state = np.zeros(capacity, dtype=np.int8)
+        self.direction = np.full(capacity, _DIR_DOWN, dtype=np.int8)
+        self.facing_right = np.ones(capacity, dtype=bool)
+        self.species = np.zeros(capacity, dtype=np.int16)
+        self.anim = np.zeros(capacity, dtype=np.int32)
+        self.frame = np.zeros(capacity)
+        # Posisi sebelum tick terakhir & posisi render (interpolasi, default = posisi simulasi)
+        self.prev_x = np.zeros(capacity)
+        self.prev_y = np.zeros(capacity)
+        self.draw_x, self.draw_y = self.x, self.y
+
+    def _grow(self):
+        old = {name: getattr(self, name)[:self.count] for name in _ARRAYS}
+        self._alloc(self.capacity * 2)
+        for name, values in old.items():
+            getattr(self, name)[:self.count] = values
+
+    def _register_species(self, name):
+        sid = self._species_ids.get(name)
+        if sid is not None:
+            return sid
+        species = get_species(name)
+        sid = len(self.species_list)
+        self.species_list.append(species)
+        self._species_ids[name] = sid
+
+        anim_ids = {}
+        rows = []
+        for state in STATES:
+            per_dir = species.state_animations.get(state) or species.state_animations["idle"]
+            row = []
+            for direction in DIRECTIONS:
+                frames, mirrored, rate = per_dir[direction]
+                key = (id(frames), rate)
+                if key not in anim_ids:
+                    anim_ids[key] = len(self._anim_frames)
+                    self._anim_frames.append((frames, mirrored))
+                    self._anim_len.append(len(frames))
+                    self._anim_rate.append(rate)
+                row.append(anim_ids[key])
+            rows.append(row)
+        self._species_anims.append(rows)
+        idle_frame = species.state_animations["idle"]["down"][0][0]
+        self._species_half.append(tuple(s // 2 for s in idle_frame.get_size()))
+        self._build_tables()
+        return sid
+
+    def _build_tables(self):
+        """Bangun ulang tabel NumPy dari data spesies yang sudah terdaftar"""
+        n_species = max(len(self.species_list), 1)
+        self.anim_len_table = np.array(self._anim_len or [1])
+        self.anim_rate_table = np.array(self._anim_rate or [0.0]) * TICK_SCALE
+        # Ukuran tiap frame animasi (id animasi, indeks frame), untuk rect render di query_rect()
+        self.frame_w = np.zeros((len(self._anim_frames) or 1, max(self._anim_len or [1])), dtype=np.int64)
+        self.frame_h = np.zeros_like(self.frame_w)
+        for anim, (frames, _) in enumerate(self._anim_frames):
+            for k, frame in enumerate(frames):
+                self.frame_w[anim, k], self.frame_h[anim, k] = frame.get_size()
+        self.anim_table = np.zeros((n_species, len(STATES), len(DIRECTIONS)), dtype=np.int32)
+        self.half_w = np.zeros(n_species)
+        self.half_h = np.zeros(n_species)
+        self.wander = np.zeros(n_species)
+
+        # Tabel transisi tiap spesies (BehaviourTable) disalin ke array bersama selebar tabel terlebar
+        width = max([species.behaviour.width for species in self.species_list] or [1])
+        shape = (n_species, len(STATES), width)
+        self.rule_cum = np.full(shape, 2.0)
+        self.rule_state = np.zeros(shape, dtype=np.int8)
+        self.rule_dur_lo = np.zeros(shape, dtype=np.int32)
+        self.rule_dur_hi = np.zeros(shape, dtype=np.int32)
+        self.rule_spd_lo = np.full(shape, np.nan)
+        self.rule_spd_hi = np.full(shape, np.nan)
+        self.rule_count = np.ones((n_species, len(STATES)), dtype=np.int32)
+
+        for sid, species in enumerate(self.species_list):
+            self.anim_table[sid] = self._species_anims[sid]
+            self.half_w[sid], self.half_h[sid] = self._species_half[sid]
+            self.wander[sid] = species.wander
+            table = species.behaviour
+            rows = (len(STATES), table.width)
+            self.rule_cum[sid, :, :table.width] = np.reshape(table.cum, rows)
+            self.rule_state[sid, :, :table.width] = np.reshape(table.next_state, rows)
+            self.rule_dur_lo[sid, :, :table.width] = np.reshape(table.dur_lo, rows)
+            self.rule_dur_hi[sid, :, :table.width] = np.reshape(table.dur_hi, rows)
+            self.rule_spd_lo[sid, :, :table.width] = np.reshape(table.spd_lo, rows)
+            self.rule_spd_hi[sid, :, :table.width] = np.reshape(table.spd_hi, rows)
+            self.rule_count[sid] = table.count
+
+    def add(self, animal_type, x, y, name="", desc="", kind="animal"):
+        """Tambah satu hewan; mengembalikan `AnimalView`-nya"""
+        sid = self._register_species(animal_type)
+        if self.count == self.capacity:
+            self._grow()
+        i = self.count
+        lo, hi = self.species_list[sid].speed_range
+        self.x[i] = self.tx[i] = self.prev_x[i] = x
+        self.y[i] = self.ty[i] = self.prev_y[i] = y
+        self.speed[i] = self.rng.uniform(lo, hi) * TICK_SCALE
+        self.due[i] = self.tick + 1
+        self.state[i] = IDLE
+        self.direction[i] = _DIR_DOWN
+        self.facing_right[i] = True
+        self.species[i] = sid
+        self.anim[i] = self.anim_table[sid, IDLE, _DIR_DOWN]
+        self.frame[i] = 0
+        self.count += 1
+        view = AnimalView(self, i, animal_type, name, desc, kind)
+        self.views.append(view)
+        return view
+
+    def _roll_transitions(self, idx):
+        """State berikutnya untuk hewan `idx` yang transisinya jatuh tempo"""
+        rng = self.rng
+        sp = self.species[idx]
+        st = self.state[idx]
+        r = rng.random(len(idx))
+        k = (r[:, None] >= self.rule_cum[sp, st]).sum(axis=1)
+        k = np.minimum(k, self.rule_count[sp, st] - 1)
+
+        new_state = self.rule_state[sp, st, k]
+        lo = self.rule_dur_lo[sp, st, k]
+        hi = self.rule_dur_hi[sp, st, k]
+        duration = lo + np.floor(rng.random(len(idx)) * (hi - lo + 1))  # Tick 60 Hz
+        self.due[idx] = self.tick + np.maximum(1, np.ceil(duration / TICK_SCALE)).astype(np.int64)
+        self.state[idx] = new_state
+
+        spd_lo = self.rule_spd_lo[sp, st, k]
+        has_speed = ~np.isnan(spd_lo)
+        if has_speed.any():
+            lo_s = spd_lo[has_speed]
+            hi_s = self.rule_spd_hi[sp, st, k][has_speed]
+            self.speed[idx[has_speed]] = rng.uniform(lo_s, hi_s) * TICK_SCALE
+
+        moving = (new_state == WALKING) | (new_state == RUNNING)
+        if moving.any():
+            m = idx[moving]
+            radius = self.wander[self.species[m]]
+            cx = self.x[m].astype(np.int64)
+            cy = self.y[m].astype(np.int64)
+            x0, x1 = np.maximum(0, cx - radius), np.minimum(MAP_WIDTH, cx + radius)
+            y0, y1 = np.maximum(0, cy - radius), np.minimum(MAP_HEIGHT, cy + radius)
+            self.tx[m] = np.floor(x0 + rng.random(len(m)) * (x1 - x0 + 1))
+            self.ty[m] = np.floor(y0 + rng.random(len(m)) * (y1 - y0 + 1))
+
+    def update(self):
+        """Satu tick simulasi untuk semua hewan"""
+        n = self.count
+        if not n:
+            return
+        self.tick += 1
+        # Tick transisi absolut: tidak ada timer yang dikurangi tiap tick
+        expired = np.flatnonzero(self.due[:n] <= self.tick)
+        if len(expired):
+            self._roll_transitions(expired)
+
+        state = self.state[:n]
+        moving = np.flatnonzero((state == WALKING) | (state == RUNNING))
+        if len(moving):
+            x, y = self.x[moving], self.y[moving]
+            dx = self.tx[moving] - x
+            dy = self.ty[moving] - y
+            dist = np.hypot(dx, dy)
+            speed = self.speed[moving]
+
+            horizontal = np.abs(dx) > np.abs(dy)
+            self.direction[moving] = np.where(
+                horizontal, np.where(dx > 0, _DIR_RIGHT, _DIR_LEFT), np.where(dy > 0, _DIR_DOWN, _DIR_UP))
+            facing = self.facing_right[moving]
+            facing[dx < 0] = False
+            facing[dx > 0] = True
+            self.facing_right[moving] = facing
+
+            walking = dist > speed
+            step = np.where(walking, speed / np.maximum(dist, 1e-9), 0.0)
+            sp = self.species[moving]
+            hw, hh = self.half_w[sp], self.half_h[sp]
+            self.x[moving] = np.clip(x + dx * step, hw, MAP_WIDTH - hw)
+            self.y[moving] = np.clip(y + dy * step, hh, MAP_HEIGHT - hh)
+            arrived = moving[~walking]
+            self.state[arrived] = IDLE
+
+        # Animasi: ganti animasi jika (state, arah) berubah, lalu majukan frame
+        anim = self.anim_table[self.species[:n], self.state[:n], self.direction[:n]]
+        frame = self.frame[:n]
+        frame[anim != self.anim[:n]] = 0
+        self.anim[:n] = anim
+        frame += self.anim_rate_table[anim]
+        frame[frame >= self.anim_len_table[anim]] = 0
+
+    def clone(self):
+        """Salinan dengan array sendiri; tabel spesies, view & rng dipakai bersama"""
+        other = copy.copy(self)
+        for name in _ARRAYS:
+            setattr(other, name, getattr(self, name).copy())
+        other.draw_x, other.draw_y = other.x, other.y
+        return other
+
+    def copy_render_state(self, other):
+        """Salin posisi, state & frame hasil simulasi `other` (hasil `clone()`) ke population ini"""
+        n = self.count
+        for name in _RENDER_ARRAYS:
+            np.copyto(getattr(self, name)[:n], getattr(other, name)[:n])
+        self.tick = other.tick
+
+    def snapshot(self):
+        """Simpan posisi sebelum tick (untuk interpolasi render)"""
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def interpolate(self, alpha):
+        """Posisi render di antara tick sebelumnya dan tick terakhir"""
+        n = self.count
+        self.draw_x = self.prev_x[:n] + (self.x[:n] - self.prev_x[:n]) * alpha
+        self.draw_y = self.prev_y[:n] + (self.y[:n] - self.prev_y[:n]) * alpha
+
+    def end_interpolation(self):
+        self.draw_x, self.draw_y = self.x, self.y
+
+    def image_of(self, i):
+        frames, mirrored = self._anim_frames[self.anim[i]]
+        idx = int(self.frame[i])
+        return frames[idx] if self.facing_right[i] else mirrored[idx]
+
+    def rect_of(self, i):
+        image = self.image_of(i)
+        return image.get_rect(center=(int(self.draw_x[i]), int(self.draw_y[i])))
+
+    def query_rect(self, rect):
+        """View hewan yang rect render-nya (sama dengan rect_of) beririsan dengan `rect`"""
+        n = self.count
+        anim = self.anim[:n]
+        frame = self.frame[:n].astype(np.intp)
+        w, h = self.frame_w[anim, frame], self.frame_h[anim, frame]
+        left = self.draw_x[:n].astype(np.int64) - w // 2
+        top = self.draw_y[:n].astype(np.int64) - h // 2
+        mask = (left + w > rect.left) & (left < rect.right) & (top + h > rect.top) & (top < rect.bottom)
+        views = self.views
+        return [views[i] for i in np.flatnonzero(mask)]
+
+    def query_radius(self, x, y, radius):
+        """View hewan yang titik tengahnya berada dalam `radius` dari (x, y)"""
+        n = self.count
+        d2 = (self.x[:n] - x) ** 2 + (self.y[:n] - y) ** 2
+        views = self.views
+        return [views[i] for i in np.flatnonzero(d2 <= radius * radius)]
@@ -0,0 +1,261 @@
+import os
+import pygame
+from src.utils.asset_loader import load_frame_grid, flatten_rows, get_mirrored_frames
+from src.models.behaviour import compile_behaviour
+
+# TABEL SPESIES
+#
+# Setiap spesies cukup didefinisikan di sini; semuanya dijalankan oleh satu
+# class `Animal` (src/models/animal.py).
+#
+#   sheet        : file di assets/animals_move
+#   grid         : (kolom, baris) pembagi ukuran sheet, atau None jika pakai frame_size
+#   frame_size   : ukuran frame tetap (w, h) di sheet
+#   row_lengths  : jumlah frame terpakai per baris (None = semua kolom)
+#   pad_top      : ruang transparan di atas frame sebelum di-scale
+#   scale        : faktor scale frame
+#   animations   : nama -> (indeks awal, jumlah) di daftar frame yang sudah di-flatten
+#   states       : state -> (animasi, kecepatan animasi), atau dict arah -> (animasi, kecepatan)
+#                  untuk spesies dengan animasi 4 arah ("left", "right", "up", "down")
+#   mirror_left  : frame dicerminkan saat menghadap kiri
+#   speed        : rentang kecepatan awal
+#   behaviour    : aturan state machine, dikompilasi ke tabel transisi (src/models/behaviour.py)
+#       transitions : state -> [(peluang, state tujuan, durasi, kecepatan atau None)]
+#       atau format ringkas:
+#       idle        : [(peluang, state, durasi, kecepatan)] dicek berurutan dari state idle
+#       idle_else   : (pilihan state, durasi) jika tidak ada peluang idle yang kena
+#       move_end    : (pilihan state, durasi) setelah walking/running selesai
+#       sleep_end   : (pilihan state, durasi) setelah sleeping selesai
+#       wander      : radius target jalan acak
+#   highlight    : (radius, tebal, offset y) lingkaran highlight
+#   fallback     : (ukuran, warna) dummy frame jika sheet gagal di-load
+
+_ROWS_6x4_4x4 = (6, 6, 6, 6, 4, 4, 4, 4)
+
+_UNGGAS_TERNAK = {
+    "grid": (6, 8),
+    "scale": 2.8,
+    "animations": {"walk": (12, 6), "idle": (24, 4), "sleep": (36, 4)},
+    "states": {"idle": ("idle", 0.08), "walking": ("walk", 0.15), "sleeping": ("sleep", 0.05)},
+    "mirror_left": True,
+    "speed": (0.5, 0.9),
+    "behaviour": {
+        "transitions": {
+            "idle": [(0.6, "walking", (100, 200), None),
+                     (0.2, "idle", (100, 200), None),
+                     (0.2, "sleeping", (100, 200), None)],
+            "walking": [(1.0, "idle", (50, 100), None)],
+            "running": [(1.0, "idle", (50, 100), None)],
+            "sleeping": [(1.0, "idle", (50, 100), None)],
+        },
+        "wander": 150,
+    },
+    "highlight": (30, 2, 10),
+    "fallback": ((50, 50), (200, 200, 200)),
+}
+
+_GENERIC_8x4 = {
+    "grid": (8, 4),
+    "scale": 0.5,
+    "animations": {"idle": (0, 8), "walk": (8, 8), "run": (16, 8), "sleep": (24, 4)},
+    "states": {"idle": ("idle", 0.12), "walking": ("walk", 0.15), "sleeping": ("sleep", 0.05)},
+    "mirror_left": True,
+    "speed": (0.3, 1.0),
+    "behaviour": {
+        "idle": [(0.6, "walking", (80, 200), (0.5, 1.2))],
+        "idle_else": (("idle", "sleeping"), (100, 250)),
+        "move_end": (("idle", "sleeping"), (100, 250)),
+        "sleep_end": (("idle",), (60, 120)),
+        "wander": 150,
+    },
+    "highlight": (35, 3, 0),
+    "fallback": ((40, 40), (200, 100, 50)),
+}
+
+SPECIES = {
+    "ayam": dict(_UNGGAS_TERNAK, sheet="ayam.png"),
+    "ayam_jantan": dict(_UNGGAS_TERNAK, sheet="ayam_jantan.png"),
+    "babi": dict(_UNGGAS_TERNAK, sheet="babi.png"),
+    "domba": dict(_UNGGAS_TERNAK, sheet="domba.png"),
+    "kambing": dict(_UNGGAS_TERNAK, sheet="kambing.png"),
+    "sapi": {
+        "sheet": "sapi.png",
+        "grid": (6, 8),
+        "row_lengths": _ROWS_6x4_4x4,
+        "scale": 1.9,
+        "animations": {
+            "idle_front": (0, 6), "idle_back": (6, 6), "idle_left": (12, 6), "idle_right": (18, 6),
+            "walk_down": (24, 4), "walk_up": (28, 4), "walk_left": (32, 4), "walk_right": (36, 4),
+            "sleep": (24, 1),
+        },
+        "states": {
+            "idle": {"left": ("idle_left", 0.1), "right": ("idle_right", 0.1),
+                     "up": ("idle_front", 0.1), "down": ("idle_front", 0.1)},
+            "walking": {"left": ("walk_left", 0.12), "right": ("walk_right", 0.12),
+                        "up": ("walk_up", 0.12), "down": ("walk_down", 0.12)},
+            "sleeping": ("sleep", 0.02),
+        },
+        "mirror_left": True,
+        "speed": (0.3, 0.8),
+        "behaviour": {
+            "idle": [(0.4, "walking", (60, 150), (0.3, 0.8))],
+            "idle_else": (("idle", "sleeping"), (150, 300)),
+            "move_end": (("idle", "sleeping"), (150, 300)),
+            "sleep_end": (("idle",), (80, 150)),
+            "wander": 120,
+        },
+        "highlight": (40, 3, 0),
+        "fallback": ((50, 50), (139, 69, 19)),
+    },
+    "anak_sapi": {
+        "sheet": "anak_sapi.png",
+        "grid": (6, 8),
+        "row_lengths": _ROWS_6x4_4x4,
+        "scale": 1.8,
+        "animations": {
+            "walk_front": (0, 6), "walk_back": (6, 6), "walk_left": (12, 6), "walk_right": (18, 6),
+            "idle_front": (24, 4), "idle_back": (28, 4), "idle_left": (32, 4), "idle_right": (36, 4),
+        },
+        "states": {
+            "idle": {"left": ("idle_left", 0.10), "right": ("idle_right", 0.10),
+                     "up": ("idle_back", 0.10), "down": ("idle_front", 0.10)},
+            "walking": {"left": ("walk_left", 0.16), "right": ("walk_right", 0.16),
+                        "up": ("walk_back", 0.16), "down": ("walk_front", 0.16)},
+            "sleeping": ("idle_front", 0.05),
+        },
+        "mirror_left": False,
+        "speed": (0.6, 1.2),
+        "behaviour": {
+            "idle": [(0.6, "walking", (60, 180), None)],
+            "idle_else": (("idle", "sleeping"), (100, 200)),
+            "move_end": (("idle", "sleeping"), (100, 200)),
+            "sleep_end": (("idle",), (80, 150)),
+            "wander": 140,
+        },
+        "highlight": (30, 3, 0),
+        "fallback": ((40, 40), (160, 82, 45)),
+    },
+    "anjing": {
+        "sheet": "anjing.png",
+        "grid": (7, 5),
+        "row_lengths": (7, 7, 7, 3),
+        "pad_top": 6,
+        "scale": 0.47,
+        "animations": {"idle": (0, 14), "walk": (14, 7), "sleep": (21, 1), "sit": (22, 2)},
+        "states": {"idle": ("idle", 0.17), "walking": ("walk", 0.19), "running": ("walk", 0.25),
+                   "sleeping": ("sleep", 0.07)},
+        "mirror_left": True,
+        "speed": (0.8, 1.6),
+        "behaviour": {
+            "idle": [(0.75, "walking", (60, 140), (0.8, 1.6)), (0.10, "running", (40, 80), (1.5, 2.2))],
+            "idle_else": (("idle", "sleeping"), (70, 150)),
+            "move_end": (("idle", "sleeping"), (70, 150)),
+            "sleep_end": (("idle",), (50, 90)),
+            "wander": 180,
+        },
+        "highlight": (34, 3, 0),
+        "fallback": ((43, 43), (200, 100, 50)),
+    },
+    "kalkun": {
+        "sheet": "kalkun.png",
+        "grid": None,
+        "frame_size": (32, 32),
+        "row_lengths": (6, 0, 6, 0, 4, 0, 4),
+        "scale": 2.5,
+        "animations": {"idle": (0, 6), "walk": (6, 6), "run": (12, 4), "sleep": (16, 4)},
+        "states": {"idle": ("idle", 0.15), "walking": ("walk", 0.2), "running": ("run", 0.3),
+                   "sleeping": ("sleep", 0.05)},
+        "mirror_left": True,
+        "speed": (0.8, 1.5),
+        "behaviour": {
+            "idle": [(0.6, "walking", (60, 200), (0.8, 1.8)), (0.2, "running", (40, 100), (2.0, 3.0))],
+            "idle_else": (("sleeping",), (100, 250)),
+            "move_end": (("idle", "sleeping"), (100, 200)),
+            "sleep_end": (("idle",), (60, 120)),
+            "wander": 300,
+        },
+        "highlight": (40, 3, 0),
+        "fallback": ((50, 50), (200, 50, 50)),
+    },
+    "kucing": dict(_GENERIC_8x4, sheet="kucing.png", scale=0.4, speed=(0.5, 1.5),
+        states={"idle": ("idle", 0.15), "walking": ("walk", 0.2), "running": ("run", 0.3),
+                "sleeping": ("sleep", 0.05)},
+        behaviour={
+            "idle": [(0.5, "walking", (60, 180), (0.8, 1.8)), (0.2, "running", (60, 120), (2.0, 3.5))],
+            "idle_else": (("sleeping",), (120, 300)),
+            "move_end": (("idle", "sleeping"), (120, 300)),
+            "sleep_end": (("idle",), (60, 120)),
+            "wander": 200,
+        },
+        fallback=((40, 40), (255, 140, 0)),
+    ),
+}
+
+DIRECTIONS = ("left", "right", "up", "down")
+
+
+class Species:
+    """Data satu spesies yang sudah di-load: frame, frame cermin, dan tabel state.
+
+    Dibuat sekali per spesies (lihat `get_species`) dan dipakai bersama oleh
+    semua instance `Animal` spesies tersebut.
+    """
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.spec = spec
+        self.mirror_left = spec.get("mirror_left", True)
+        self.speed_range = spec["speed"]
+        self.highlight = spec["highlight"]
+
+        frames = self._load_frames()
+        self.animations = {}
+        self.mirrored = {}
+        for anim_name, (start, count) in spec["animations"].items():
+            anim = frames[start:start + count] or frames[:1]
+            self.animations[anim_name] = anim
+            self.mirrored[anim_name] = get_mirrored_frames((name, anim_name), anim) if self.mirror_left else anim
+
+        # state -> arah -> (frames, frames cermin, kecepatan animasi)
+        self.state_animations = {}
+        for state, entry in spec["states"].items():
+            per_dir = entry if isinstance(entry, dict) else {d: entry for d in DIRECTIONS}
+            self.state_animations[state] = {
+                d: (self.animations[anim], self.mirrored[anim], rate) for d, (anim, rate) in per_dir.items()
+            }
+        # Spesies tanpa animasi lari memakai animasi jalan
+        self.state_animations.setdefault("running", self.state_animations["walking"])
+
+        # Tabel transisi datar, dipakai Animal (roll) dan Population (array NumPy)
+        self.behaviour = compile_behaviour(spec["behaviour"])
+        self.wander = self.behaviour.wander
+
+    def _load_frames(self):
+        spec = self.spec
+        try:
+            path = os.path.join("assets", "animals_move", spec["sheet"])
+            cols, rows = spec["grid"] or (1, 1)
+            frames = flatten_rows(load_frame_grid(
+                path, cols=cols, rows=rows, scale=spec["scale"], row_lengths=spec.get("row_lengths"),
+                frame_size=spec.get("frame_size"), pad_top=spec.get("pad_top", 0)
+            ))
+            if frames:
+                return frames
+        except Exception as e:
+            print(f"[ERROR] Gagal load {self.name}: {e}")
+        size, color = spec["fallback"]
+        dummy = pygame.Surface(size)
+        dummy.fill(color)
+        count = max(start + length for start, length in spec["animations"].values())
+        return (dummy,) * count
+
+
+_LOADED_SPECIES = {}
+
+def get_species(name):
+    """Species yang sudah di-load (frame di-decode sekali per spesies)"""
+    species = _LOADED_SPECIES.get(name)
+    if species is None:
+        species = Species(name, SPECIES[name])
+        _LOADED_SPECIES[name] = species
+    return species
@@ -1,50 +1,241 @@
 import os
+import weakref
 import pygame
-from src.config import BASE_DIR
+from collections import OrderedDict
+from src.config import BASE_DIR, ASSET_CACHE_MAX_BYTES
+from src.utils.profiler import startup_profiler
+
+
+class AssetCache:
+    """Cache proses untuk image dan frame sprite sheet yang sudah di-decode & di-scale.
+
+    Value yang disimpan immutable (Surface tunggal atau tuple baris berisi
+    tuple frame) dan dipakai bersama semua pemanggil, jadi pemanggil tidak
+    boleh menggambar ke surface hasil cache.
+
+    Cache memegang referensi kuat untuk entry terbaru sampai `max_bytes`
+    (LRU). Entry yang keluar dari LRU masih bisa dipakai ulang lewat weakref
+    selama ada entity yang memegang framenya; begitu tidak ada yang memakai,
+    memorinya dilepas dan load berikutnya decode ulang dari disk.
+    """
+
+    def __init__(self, max_bytes=ASSET_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._strong = OrderedDict()  # key -> value (LRU)
+        self._sizes = {}              # key -> bytes
+        self._weak = {}               # key -> (shape, tuple weakref per surface)
+        self.bytes_used = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._strong)
+
+    def __contains__(self, key):
+        return key in self._strong or self._revive(key) is not None
+
+    @staticmethod
+    def _flatten(value):
+        if isinstance(value, tuple):
+            return [frame for row in value for frame in row]
+        return [value]
+
+    @staticmethod
+    def _shape(value):
+        return tuple(len(row) for row in value) if isinstance(value, tuple) else None
+
+    @staticmethod
+    def _size_of(surfaces):
+        return sum(s.get_pitch() * s.get_height() for s in surfaces)
+
+    def _revive(self, key):
+        """Bangun ulang value dari weakref jika semua surface-nya masih hidup"""
+        entry = self._weak.get(key)
+        if entry is None:
+            return None
+        shape, refs = entry
+        surfaces = [ref() for ref in refs]
+        if any(s is None for s in surfaces):
+            del self._weak[key]
+            return None
+        if shape is None:
+            return surfaces[0]
+        rows, i = [], 0
+        for length in shape:
+            rows.append(tuple(surfaces[i:i + length]))
+            i += length
+        return tuple(rows)
+
+    def _keep(self, key, value, surfaces):
+        size = self._size_of(surfaces)
+        self._strong[key] = value
+        self._sizes[key] = size
+        self.bytes_used += size
+        if self.bytes_used > self.max_bytes:
+            self.trim()
+
+    def get(self, key, loader):
+        """Ambil value untuk `key`, panggil `loader()` hanya jika belum ada"""
+        value = self._strong.get(key)
+        if value is not None:
+            self.hits += 1
+            self._strong.move_to_end(key)
+            return value
+        value = self._revive(key)
+        if value is not None:
+            self.hits += 1
+            self._keep(key, value, self._flatten(value))
+            return value
+        self.misses += 1
+        value = loader()
+        surfaces = self._flatten(value)
+        self._weak[key] = (self._shape(value), tuple(weakref.ref(s) for s in surfaces))
+        self._keep(key, value, surfaces)
+        return value
+
+    def trim(self, max_bytes=None):
+        """Lepas referensi kuat entry tertua sampai total di bawah `max_bytes`"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        while self._strong and self.bytes_used > limit:
+            key, _ = self._strong.popitem(last=False)
+            self.bytes_used -= self._sizes.pop(key)
+
+    def release_unused(self):
+        """Lepas semua referensi kuat; sheet yang tidak dipakai entity ikut dibebaskan"""
+        self.trim(0)
+        for key in list(self._weak):
+            self._revive(key)
+
+    def clear(self):
+        self._strong.clear()
+        self._sizes.clear()
+        self._weak.clear()
+        self.bytes_used = 0
+
+    def live_bytes(self):
+        """Total ukuran semua sheet yang masih hidup (di-cache atau dipegang entity)"""
+        total = 0
+        for key in list(self._weak):
+            value = self._strong.get(key)
+            if value is None:
+                value = self._revive(key)
+            if value is not None:
+                total += self._size_of(self._flatten(value))
+        return total
+
+    def stats(self):
+        return {
+            "entries": len(self._strong),
+            "tracked": len(self._weak),
+            "bytes": self.bytes_used,
+            "live_bytes": self.live_bytes(),
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Cache bersama untuk seluruh proses
+asset_cache = AssetCache()
+
 
 def get_asset_path(*paths):
     """Mendapatkan path lengkap ke asset"""
     return os.path.join(BASE_DIR, *paths)
 
+def _asset_name(full_path):
+    return os.path.relpath(full_path, BASE_DIR)
+
+def _load_image(full_path, scale):
+    with startup_profiler.measure("decode", _asset_name(full_path)):
+        image = pygame.image.load(full_path).convert_alpha()
+    if scale != 1:
+        with startup_profiler.measure("scale", _asset_name(full_path)):
+            image = pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
+    return image
+
 def load_image_safe(relative_path, scale=1, flags=0):
-    """Load image dengan error handling"""
+    """Load image dengan error handling (hasil di-cache dan dipakai bersama)"""
     full_path = get_asset_path(relative_path)
     try:
-        image = pygame.image.load(full_path).convert_alpha()
-        if scale != 1:
-            image = pygame.transform.scale(image, (int(image.get_width() * scale), int(image.get_height() * scale)))
-        return image
+        return asset_cache.get(("image", full_path, scale, flags), lambda: _load_image(full_path, scale))
     except FileNotFoundError:
         dummy = pygame.Surface((40, 40))
-        dummy.fill((255, 0, 0)) 
+        dummy.fill((255, 0, 0))
         return dummy
 
+def _load_frame_grid(full_path, cols, rows, scale, row_lengths, frame_size, pad_top):
+    with startup_profiler.measure("decode", _asset_name(full_path)):
+        sheet = pygame.image.load(full_path).convert_alpha()
+    with startup_profiler.measure("scale", _asset_name(full_path)):
+        return _slice_frame_grid(sheet, cols, rows, scale, row_lengths, frame_size, pad_top)
+
+def _slice_frame_grid(sheet, cols, rows, scale, row_lengths, frame_size, pad_top):
+    sheet_w, sheet_h = sheet.get_size()
+    if frame_size:
+        frame_w, frame_h = frame_size
+        cols, rows = sheet_w // frame_w, sheet_h // frame_h
+    else:
+        frame_w, frame_h = sheet_w // cols, sheet_h // rows
+    if row_lengths is None:
+        row_lengths = (cols,) * rows
+
+    target_w = int(frame_w * scale)
+    target_h = int((frame_h + pad_top) * scale)
+    result = []
+    for row, count in enumerate(row_lengths):
+        frames = []
+        y = row * frame_h
+        for col in range(count):
+            x = col * frame_w
+            if x + frame_w > sheet_w or y + frame_h > sheet_h:
+                break
+            frame = sheet.subsurface(pygame.Rect(x, y, frame_w, frame_h))
+            if pad_top:
+                padded = pygame.Surface((frame_w, frame_h + pad_top), pygame.SRCALPHA)
+                padded.blit(frame, (0, pad_top))
+                frame = padded
+            if scale != 1:
+                frame = pygame.transform.scale(frame, (target_w, target_h))
+            frames.append(frame)
+        result.append(tuple(frames))
+    return tuple(result)
+
+def load_frame_grid(relative_path, cols=1, rows=1, scale=1, row_lengths=None, frame_size=None, pad_top=0):
+    """Load sprite sheet berbentuk grid sebagai tuple baris (tiap baris tuple frame).
+
+    Ukuran frame = ukuran sheet / (cols, rows), kecuali `frame_size` diberikan
+    (cols & rows lalu dihitung dari ukuran sheet).
+    `row_lengths` membatasi jumlah frame per baris, `pad_top` menambah ruang
+    transparan di atas frame sebelum di-scale. Hasil di-cache per kombinasi
+    parameter; error (file tidak ada, dll) diteruskan ke pemanggil.
+    """
+    full_path = get_asset_path(relative_path)
+    row_lengths = tuple(row_lengths) if row_lengths is not None else None
+    key = ("grid", full_path, cols, rows, scale, row_lengths, frame_size, pad_top)
+    return asset_cache.get(key, lambda: _load_frame_grid(full_path, cols, rows, scale, row_lengths, frame_size, pad_top))
+
+def flatten_rows(rows):
+    """Gabungkan tuple baris hasil `load_frame_grid` menjadi satu tuple frame"""
+    return tuple(frame for row in rows for frame in row)
+
 def load_spritesheet_safe(relative_path, frame_width, frame_height, scale=1, flags=0):
     """Load spritesheet dengan error handling"""
-    full_path = get_asset_path(relative_path)
     try:
-        sheet = pygame.image.load(full_path).convert_alpha()
-        sheet_w, sheet_h = sheet.get_size()
-        frames = []
-        
-        cols = sheet_w // frame_width
-        rows = sheet_h // frame_height
-        
-        for row in range(rows):
-            for col in range(cols):
-                x = col * frame_width
-                y = row * frame_height
-                
-                if x + frame_width <= sheet_w and y + frame_height <= sheet_h:
-                    frame = sheet.subsurface(pygame.Rect(x, y, frame_width, frame_height))
-                    if scale != 1:
-                        frame = pygame.transform.scale(frame, (int(frame_width * scale), int(frame_height * scale)))
-                    frames.append(frame)
-                    
-        return frames
+        rows = load_frame_grid(relative_path, scale=scale, frame_size=(frame_width, frame_height))
+        return flatten_rows(rows)
     except FileNotFoundError:
         print(f"[WARNING] Spritesheet tidak ditemukan: {relative_path}")
-        return []
+        return ()
     except Exception as e:
         print(f"[ERROR] Gagal load spritesheet {relative_path}: {e}")
-        return []
+        return ()
+
+def get_mirrored_frames(key, frames):
+    """Versi cermin horizontal dari `frames`, dibuat sekali per key lalu dipakai bersama.
+
+    Disimpan di `asset_cache` (satu baris frame), jadi ikut batas memori LRU-nya.
+    """
+    rows = asset_cache.get(("mirror", key, len(frames)),
+                           lambda: (tuple(pygame.transform.flip(frame, True, False) for frame in frames),))
+    return rows[0]
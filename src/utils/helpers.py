@@ -4,15 +4,29 @@ def calculate_distance(r1, r2):
     """Menghitung jarak Euclidean antara dua rect"""
     return math.sqrt((r1.centerx-r2.centerx)**2 + (r1.centery-r2.centery)**2)
 
-def get_safe_random_pos(existing_objects, margin=200, min_dist=150):
-    """Mendapatkan posisi random yang aman tanpa collision"""
+def get_safe_random_pos(existing_objects, margin=200, min_dist=150, grid=None, kinds=None, rng=None, population=None):
+    """Mendapatkan posisi random yang aman tanpa collision
+
+    Jika `grid` (SpatialGrid) diberikan, pengecekan collision memakai query
+    radius di grid dan `existing_objects` diabaikan. Hewan `population`
+    (Population NumPy) tidak ada di grid, jadi dicek lewat query radius-nya
+    sendiri. `rng` (random.Random) default-nya modul random global.
+    """
     import random
     from src.config import MAP_WIDTH, MAP_HEIGHT
+    rng = rng if rng is not None else random
     
     max_attempts = 100 
     for _ in range(max_attempts):
-        x = random.randint(margin, MAP_WIDTH - margin)
-        y = random.randint(margin, MAP_HEIGHT - margin)
+        x = rng.randint(margin, MAP_WIDTH - margin)
+        y = rng.randint(margin, MAP_HEIGHT - margin)
+        
+        if population is not None and population.query_radius(x, y, min_dist):
+            continue
+        if grid is not None:
+            if not grid.query_radius(x, y, min_dist, kinds):
+                return x, y
+            continue
         
         collision = False
         for obj in existing_objects:
@@ -25,4 +39,4 @@ def get_safe_random_pos(existing_objects, margin=200, min_dist=150):
         if not collision:
             return x, y
     
-    return random.randint(margin, MAP_WIDTH - margin), random.randint(margin, MAP_HEIGHT - margin)
+    return rng.randint(margin, MAP_WIDTH - margin), rng.randint(margin, MAP_HEIGHT - margin)
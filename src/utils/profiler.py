@@ -0,0 +1,246 @@
+import json
+import platform
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from src.config import FRAME_PROFILE_WINDOW
+
+
+class StartupProfiler:
+    """Pencatat waktu fase startup (display, audio, asset, generasi procedural, ...).
+
+    Fase utama dicatat berurutan lewat `begin()` / `end()`; detail yang lebih
+    halus (decode satu asset, rasterize sprite) lewat `measure()` dan dicatat
+    bersama nama fase yang sedang berjalan. Saat tidak aktif semua method
+    langsung kembali, jadi aman dipanggil dari kode loader.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.origin = None
+        self.phases = []   # {"name", "start", "seconds"}
+        self.details = []  # {"category", "name", "phase", "seconds"}
+        self._current = None
+
+    def enable(self, origin=None):
+        self.enabled = True
+        self.origin = origin if origin is not None else time.perf_counter()
+
+    def record(self, name, start, end):
+        """Catat fase yang waktunya diukur di luar profiler (misal import)"""
+        if self.enabled:
+            self.phases.append({"name": name, "start": start - self.origin, "seconds": end - start})
+
+    def begin(self, name):
+        """Mulai fase baru (fase sebelumnya otomatis diakhiri)"""
+        if not self.enabled:
+            return
+        self.end()
+        self._current = (name, time.perf_counter())
+
+    def end(self):
+        if self._current is None:
+            return
+        name, start = self._current
+        self._current = None
+        self.record(name, start, time.perf_counter())
+
+    @contextmanager
+    def measure(self, category, name):
+        """Ukur satu langkah detail di dalam fase yang sedang berjalan"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.details.append({
+                "category": category,
+                "name": name,
+                "phase": self._current[0] if self._current else None,
+                "seconds": time.perf_counter() - start,
+            })
+
+    def report(self):
+        total = sum(p["seconds"] for p in self.phases)
+        by_category = {}
+        for d in self.details:
+            by_category[d["category"]] = by_category.get(d["category"], 0.0) + d["seconds"]
+        return {
+            "total_seconds": total,
+            "phases": self.phases,
+            "details": self.details,
+            "detail_totals": by_category,
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+
+    def write_json(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2)
+
+    def summary(self, top=10):
+        """Ringkasan teks untuk dicetak ke konsol"""
+        report = self.report()
+        total = report["total_seconds"] or 1e-9
+        lines = [f"Startup: {report['total_seconds'] * 1000:.1f} ms"]
+        for p in self.phases:
+            lines.append(f"  {p['name']:<20} {p['seconds'] * 1000:8.1f} ms  {p['seconds'] / total * 100:5.1f}%")
+        if self.details:
+            lines.append(f"  {top} langkah terlama:")
+            for d in sorted(self.details, key=lambda d: d["seconds"], reverse=True)[:top]:
+                lines.append(f"    [{d['category']}] {d['name']} ({d['phase']}): {d['seconds'] * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+# Profiler startup bersama (nonaktif kecuali --profile-startup)
+startup_profiler = StartupProfiler()
+
+
+class _Section:
+    """Timer scoped untuk satu nama section (dipakai ulang, tidak dialokasi per frame)"""
+    __slots__ = ("totals", "name", "start")
+
+    def __init__(self, totals, name):
+        self.totals = totals
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        totals = self.totals
+        totals[self.name] = totals.get(self.name, 0.0) + time.perf_counter() - self.start
+
+
+class _NullSection:
+    __slots__ = ()
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NULL_SECTION = _NullSection()
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile dari list yang sudah terurut"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct / 100.0 * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+class FrameProfiler:
+    """Timer per fase frame (input, update, render, ...) dan counter per frame.
+
+    `section(name)` dipakai sebagai context manager; waktu section dengan nama
+    sama dalam satu frame dijumlahkan. `end_frame()` memasukkan total frame
+    ke riwayat bergulir sepanjang `window` frame untuk mean/percentile.
+    Saat tidak aktif `section()` mengembalikan context kosong bersama dan
+    `count()` langsung kembali, jadi biayanya cukup satu pemanggilan method.
+    """
+
+    def __init__(self, window=FRAME_PROFILE_WINDOW):
+        self.window = window
+        self.enabled = False
+        self.show_overlay = False
+        self.frames = 0
+        self._sections = {}   # nama -> _Section
+        self._totals = {}     # nama -> detik di frame berjalan
+        self._counters = {}   # nama -> nilai di frame berjalan
+        self._history = {}    # nama -> deque detik per frame
+        self._counter_history = {}
+        self._frame_start = None
+
+    def set_enabled(self, enabled):
+        if enabled and not self.enabled:
+            self.reset()
+        self.enabled = enabled
+
+    def toggle_overlay(self):
+        """Tampilkan/sembunyikan overlay (F3); profiler ikut aktif selama overlay tampil"""
+        self.show_overlay = not self.show_overlay
+        self.set_enabled(self.show_overlay)
+
+    def reset(self):
+        self.frames = 0
+        self._totals.clear()
+        self._counters.clear()
+        self._history.clear()
+        self._counter_history.clear()
+        self._frame_start = None
+
+    def section(self, name):
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self._sections.get(name)
+        if section is None:
+            section = self._sections[name] = _Section(self._totals, name)
+        return section
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def max(self, name, value):
+        """Counter berisi nilai terbesar dalam satu frame (bukan dijumlahkan)"""
+        if self.enabled:
+            counters = self._counters
+            if name not in counters or value > counters[name]:
+                counters[name] = value
+
+    def begin_frame(self):
+        if self.enabled:
+            self._frame_start = time.perf_counter()
+
+    def end_frame(self):
+        if not self.enabled or self._frame_start is None:
+            return
+        self._totals["frame"] = time.perf_counter() - self._frame_start
+        self._frame_start = None
+        for source, history in ((self._totals, self._history), (self._counters, self._counter_history)):
+            for name, value in source.items():
+                values = history.get(name)
+                if values is None:
+                    # Section yang baru muncul dianggap 0 di frame-frame sebelumnya
+                    values = history[name] = deque([0] * min(self.frames, self.window), maxlen=self.window)
+                values.append(value)
+            for name, values in history.items():
+                if name not in source:
+                    values.append(0)
+            source.clear()
+        self.frames += 1
+
+    def stats(self):
+        """{nama: {mean, p50, p95, p99, max}} dalam milidetik (section) / nilai (counter)"""
+        result = {}
+        for history, unit in ((self._history, 1000.0), (self._counter_history, 1)):
+            for name, values in history.items():
+                ordered = sorted(values)
+                n = len(ordered) or 1
+                result[name] = {
+                    "mean": sum(ordered) / n * unit,
+                    "p50": percentile(ordered, 50) * unit,
+                    "p95": percentile(ordered, 95) * unit,
+                    "p99": percentile(ordered, 99) * unit,
+                    "max": (ordered[-1] if ordered else 0) * unit,
+                }
+        return result
+
+    def section_names(self):
+        return list(self._history)
+
+    def counter_names(self):
+        return list(self._counter_history)
+
+
+# Profiler frame bersama (aktif lewat F3 atau benchmark)
+frame_profiler = FrameProfiler()
@@ -0,0 +1,41 @@
+import random
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, hanya untuk stream Population
+    np = None
+
+
+def derive_seed(seed, *names):
+    """Seed 64-bit stabil untuk (seed, nama stream); tidak memakai hash() yang diacak per proses"""
+    payload = "/".join([str(seed), *map(str, names)]).encode()
+    return int.from_bytes(hashlib.sha256(payload).digest()[:8], "little")
+
+
+class WorldRng:
+    """Sumber semua RNG dunia game yang diturunkan dari satu seed.
+
+    Tiap subsistem (spawn, rumput, AI tiap entity, ...) mendapat stream
+    sendiri lewat `stream(nama...)`, jadi menambah atau mengubah pemakaian
+    random di satu subsistem tidak menggeser hasil subsistem lain. Seed yang
+    sama menghasilkan dunia dan jalannya simulasi yang sama persis.
+    """
+
+    def __init__(self, seed=None):
+        # Tanpa seed: acak, tapi tetap dicatat supaya run-nya bisa diulang
+        self.seed = seed if seed is not None else random.SystemRandom().getrandbits(32)
+
+    def stream(self, *names):
+        """`random.Random` untuk stream `names`"""
+        return random.Random(derive_seed(self.seed, *names))
+
+    def numpy(self, *names):
+        """`numpy.random.Generator` untuk stream `names`"""
+        if np is None:
+            raise RuntimeError("Stream NumPy membutuhkan NumPy")
+        return np.random.default_rng(derive_seed(self.seed, *names))
+
+    def int_seed(self, *names, bits=32):
+        """Seed integer untuk fungsi yang menerima seed (misal create_boundary_trees)"""
+        return derive_seed(self.seed, *names) & ((1 << bits) - 1)
@@ -0,0 +1,116 @@
+import pygame
+from src.config import GRID_CELL_SIZE
+
+
+class SpatialGrid:
+    """Uniform grid (spatial hash) untuk semua entity dunia.
+
+    Setiap entity disimpan di semua cell yang disentuh rect-nya, dipisah per
+    `kind` ("grass", "tree", "animal", ...) supaya query bisa dibatasi ke jenis
+    tertentu. Query hanya membuka cell yang beririsan, jadi biayanya sebanding
+    dengan jumlah hasil, bukan ukuran map.
+    """
+
+    def __init__(self, cell_size=GRID_CELL_SIZE):
+        self.cell_size = cell_size
+        self._cells = {}    # kind -> {(cx, cy): {id(obj): obj}}
+        self._entries = {}  # id(obj) -> [obj, rect, cell_range, kind]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self._entries
+
+    def _cell_range(self, rect):
+        cs = self.cell_size
+        return (rect.left // cs, rect.top // cs, (rect.right - 1) // cs, (rect.bottom - 1) // cs)
+
+    def _add_to_cells(self, obj, cell_range, kind):
+        cells = self._cells.setdefault(kind, {})
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                cells.setdefault((cx, cy), {})[id(obj)] = obj
+
+    def _remove_from_cells(self, obj, cell_range, kind):
+        cells = self._cells[kind]
+        x0, y0, x1, y1 = cell_range
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is not None:
+                    bucket.pop(id(obj), None)
+                    if not bucket:
+                        del cells[(cx, cy)]
+
+    def insert(self, obj, rect=None, kind="sprite"):
+        """Daftarkan entity. Tanpa `rect`, dipakai `obj.rect`"""
+        if id(obj) in self._entries:
+            self.update(obj, rect)
+            return
+        rect = rect if rect is not None else obj.rect
+        cell_range = self._cell_range(rect)
+        self._entries[id(obj)] = [obj, rect, cell_range, kind]
+        self._add_to_cells(obj, cell_range, kind)
+
+    def remove(self, obj):
+        entry = self._entries.pop(id(obj), None)
+        if entry is not None:
+            self._remove_from_cells(obj, entry[2], entry[3])
+
+    def update(self, obj, rect=None):
+        """Sinkronkan posisi entity setelah rect-nya berubah"""
+        entry = self._entries.get(id(obj))
+        if entry is None:
+            return
+        rect = rect if rect is not None else obj.rect
+        entry[1] = rect
+        cell_range = self._cell_range(rect)
+        if cell_range != entry[2]:
+            self._remove_from_cells(obj, entry[2], entry[3])
+            self._add_to_cells(obj, cell_range, entry[3])
+            entry[2] = cell_range
+
+    def rect_of(self, obj):
+        return self._entries[id(obj)][1]
+
+    def kind_of(self, obj):
+        return self._entries[id(obj)][3]
+
+    def _candidates(self, rect, kinds):
+        x0, y0, x1, y1 = self._cell_range(rect)
+        if kinds is None:
+            kinds = self._cells.keys()
+        elif isinstance(kinds, str):
+            kinds = (kinds,)
+        seen = {}
+        for kind in kinds:
+            cells = self._cells.get(kind)
+            if not cells:
+                continue
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    bucket = cells.get((cx, cy))
+                    if bucket:
+                        seen.update(bucket)
+        return seen
+
+    def query_rect(self, rect, kinds=None):
+        """Semua entity yang rect-nya beririsan dengan `rect`"""
+        entries = self._entries
+        return [obj for key, obj in self._candidates(rect, kinds).items()
+                if entries[key][1].colliderect(rect)]
+
+    def query_radius(self, x, y, radius, kinds=None):
+        """Semua entity yang titik tengahnya berada dalam `radius` dari (x, y)"""
+        r = int(radius) + 1
+        area = pygame.Rect(x - r, y - r, r * 2, r * 2)
+        entries = self._entries
+        r2 = radius * radius
+        result = []
+        for key, obj in self._candidates(area, kinds).items():
+            cx, cy = entries[key][1].center
+            if (cx - x) ** 2 + (cy - y) ** 2 <= r2:
+                result.append(obj)
+        return result
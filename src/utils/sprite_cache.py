@@ -0,0 +1,127 @@
+import os
+import json
+import struct
+import hashlib
+import types
+import pygame
+from src.config import SPRITE_DISK_CACHE, SPRITE_CACHE_DIR, SPRITE_CACHE_MAX_BYTES
+
+_MAGIC = b"FSPR"
+_HEADER = struct.Struct("<4sII4s")  # magic, width, height, format pixel
+
+
+def _update_code_digest(digest, code):
+    # Hanya bytecode, nama & konstanta: nomor baris tidak ikut, jadi mengedit
+    # kode lain di atas fungsi generator tidak membuang cache
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            _update_code_digest(digest, const)
+        else:
+            digest.update(repr(const).encode())
+
+
+def code_hash(*funcs):
+    """Hash bytecode fungsi generator; berubah jika kode generatornya diubah"""
+    digest = hashlib.sha1()
+    for func in funcs:
+        _update_code_digest(digest, func.__code__)
+    return digest.hexdigest()
+
+
+class SpriteDiskCache:
+    """Cache di disk untuk buffer pixel sprite hasil rasterize procedural (cairo).
+
+    Entry di-key dengan hash dari (nama generator, versi, hash kode generator,
+    parameter, seed), jadi mengubah kode atau parameter otomatis memakai entry
+    baru. Isi file adalah header kecil + buffer pixel mentah yang dimuat balik
+    lewat `pygame.image.frombuffer` tanpa decode. Total ukuran direktori
+    dibatasi `max_bytes`; entry yang paling lama tidak dipakai dihapus dulu.
+    """
+
+    def __init__(self, directory=SPRITE_CACHE_DIR, max_bytes=SPRITE_CACHE_MAX_BYTES, enabled=SPRITE_DISK_CACHE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(name, version, code, params):
+        payload = json.dumps([name, version, code, params], sort_keys=True, default=str)
+        return hashlib.sha1(payload.encode()).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".spr")
+
+    def load(self, key):
+        """(width, height, format, buffer) dari disk, atau None jika tidak ada/rusak"""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            data = bytearray(os.path.getsize(path))
+            with open(path, "rb") as f:
+                f.readinto(data)
+            magic, width, height, fmt = _HEADER.unpack_from(data)
+            if magic != _MAGIC or len(data) - _HEADER.size != width * height * 4:
+                raise ValueError("entry cache rusak")
+            os.utime(path)  # Tandai baru dipakai (untuk eviction LRU)
+        except (OSError, struct.error, ValueError):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return width, height, fmt.decode(), memoryview(data)[_HEADER.size:]
+
+    def store(self, key, width, height, fmt, buf):
+        if not self.enabled:
+            return
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = self._path(key) + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(_HEADER.pack(_MAGIC, width, height, fmt.encode()))
+                f.write(buf)
+            os.replace(tmp, self._path(key))
+        except OSError as e:
+            print(f"[WARNING] Gagal menyimpan cache sprite: {e}")
+            return
+        self.trim()
+
+    def trim(self, max_bytes=None):
+        """Hapus entry terlama sampai total ukuran di bawah `max_bytes`"""
+        limit = self.max_bytes if max_bytes is None else max_bytes
+        try:
+            entries = [e for e in os.scandir(self.directory) if e.name.endswith(".spr")]
+        except OSError:
+            return
+        stats = [(e.stat().st_mtime, e.stat().st_size, e.path) for e in entries]
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in sorted(stats):
+            if total <= limit:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    def get_buffer(self, name, version, code, params, rasterize):
+        """Buffer pixel (width, height, format, buffer); `rasterize()` hanya dipanggil saat miss"""
+        key = self.make_key(name, version, code, params)
+        entry = self.load(key)
+        if entry is not None:
+            return entry
+        width, height, fmt, buf = rasterize()
+        self.store(key, width, height, fmt, buf)
+        return width, height, fmt, buf
+
+
+def surface_from_buffer(width, height, fmt, buf):
+    """Surface pygame yang langsung memakai buffer (tanpa copy)"""
+    return pygame.image.frombuffer(buf, (width, height), fmt)
+
+
+# Cache bersama untuk seluruh proses
+sprite_disk_cache = SpriteDiskCache()
@@ -0,0 +1,73 @@
+import pygame
+from collections import OrderedDict
+from src.config import TEXT_CACHE_SIZE
+
+# Font bersama per (nama file, ukuran)
+_FONTS = {}
+
+
+def get_font(size, name=None):
+    """Font bersama untuk (name, size); pygame.font cukup di-init sekali"""
+    key = (name, size)
+    font = _FONTS.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        font = pygame.font.Font(name, size)
+        _FONTS[key] = font
+    return font
+
+
+class TextCache:
+    """Cache LRU untuk surface teks dan panel HUD.
+
+    Teks di-key dengan (text, font, warna, antialias), panel dengan
+    (ukuran, warna, alpha). Surface hasil cache dipakai bersama, jadi
+    pemanggil tidak boleh menggambar ke surface tersebut.
+    """
+
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _get(self, key, create):
+        surf = self._entries.get(key)
+        if surf is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return surf
+        self.misses += 1
+        surf = create()
+        self._entries[key] = surf
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return surf
+
+    def render(self, text, size, color, antialias=True, font_name=None):
+        """Surface teks (seperti `Font.render`), di-render sekali per kombinasi"""
+        key = ("text", text, font_name, size, tuple(color), antialias)
+        return self._get(key, lambda: get_font(size, font_name).render(text, antialias, color))
+
+    def panel(self, size, color, alpha=None):
+        """Surface persegi berwarna solid dengan alpha surface (background HUD)"""
+        key = ("panel", tuple(size), tuple(color), alpha)
+
+        def create():
+            surf = pygame.Surface(size)
+            surf.fill(color)
+            if alpha is not None:
+                surf.set_alpha(alpha)
+            return surf
+        return self._get(key, create)
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Cache bersama untuk semua kode UI
+text_cache = TextCache()
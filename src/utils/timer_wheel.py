@@ -0,0 +1,44 @@
+class TimerWheel:
+    """Hashed timer wheel untuk event per tick (misal transisi state hewan).
+
+    Event dengan tick jatuh tempo `due` disimpan di slot `due % size`;
+    event yang jatuh tempo lebih dari satu putaran lagi tetap di slot itu
+    sampai tick-nya benar-benar tiba. `pop_due(now)` hanya menyentuh slot
+    tick yang lewat, jadi biaya per tick sebanding jumlah event yang jatuh
+    tempo, bukan jumlah semua timer yang terdaftar.
+    """
+
+    def __init__(self, size=256):
+        if size & (size - 1):
+            raise ValueError("size harus pangkat 2")
+        self._mask = size - 1
+        self._slots = [[] for _ in range(size)]
+        self._current = 0  # Tick terakhir yang sudah diproses
+        self._count = 0
+
+    def __len__(self):
+        return self._count
+
+    def schedule(self, item, due):
+        """Jadwalkan `item` pada tick `due` (tick yang sudah lewat -> tick berikutnya)"""
+        due = max(int(due), self._current + 1)
+        self._slots[due & self._mask].append((due, item))
+        self._count += 1
+
+    def pop_due(self, now):
+        """Semua item yang jatuh tempo sampai tick `now`, berurutan per tick"""
+        result = []
+        slots, mask = self._slots, self._mask
+        # Tick yang terlewat lebih dari satu putaran cukup disapu sekali per slot
+        start = max(self._current + 1, now - mask)
+        for tick in range(start, now + 1):
+            slot = slots[tick & mask]
+            if not slot:
+                continue
+            keep = [entry for entry in slot if entry[0] > now]
+            if len(keep) != len(slot):
+                result.extend(entry for entry in slot if entry[0] <= now)
+                slot[:] = keep
+        self._current = max(self._current, now)
+        self._count -= len(result)
+        return [item for _, item in sorted(result, key=lambda entry: entry[0])]
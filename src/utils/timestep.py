@@ -0,0 +1,63 @@
+from src.config import SIM_HZ, MAX_SIM_STEPS
+
+
+class FixedTimestep:
+    """Akumulator waktu untuk loop simulasi fixed-timestep.
+
+    `advance(elapsed)` menambah waktu nyata sejak frame sebelumnya dan
+    mengembalikan jumlah tick yang harus dijalankan; `alpha` adalah posisi
+    frame render di antara tick terakhir dan tick berikutnya (0..1).
+    """
+
+    def __init__(self, hz=SIM_HZ, max_steps=MAX_SIM_STEPS):
+        self.dt = 1.0 / hz
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+
+    def advance(self, elapsed):
+        self.accumulator += elapsed
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            # Terlalu lambat: lewati sisa waktu daripada menumpuk tick
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        return min(self.accumulator / self.dt, 1.0)
+
+
+class RectInterpolator:
+    """Posisi render rect di antara dua tick simulasi.
+
+    `snapshot()` dipanggil sebelum tiap tick untuk menyimpan posisi lama.
+    `apply(alpha)` memindah sementara rect ke posisi interpolasi untuk render,
+    lalu `restore()` mengembalikan posisi simulasi.
+    """
+
+    def __init__(self):
+        self._prev = []
+        self._saved = []
+
+    def snapshot(self, objects):
+        self._prev = [(obj.rect, obj.rect.x, obj.rect.y) for obj in objects]
+
+    def apply(self, alpha):
+        saved = self._saved
+        for rect, x0, y0 in self._prev:
+            x1, y1 = rect.x, rect.y
+            if x1 != x0 or y1 != y0:
+                saved.append((rect, x1, y1))
+                rect.x = round(x0 + (x1 - x0) * alpha)
+                rect.y = round(y0 + (y1 - y0) * alpha)
+
+    def restore(self):
+        for rect, x, y in self._saved:
+            rect.x = x
+            rect.y = y
+        self._saved.clear()
@@ -0,0 +1,84 @@
+import pygame
+from src.config import DIRTY_TILE_SIZE, DIRTY_FULL_RATIO
+
+
+class DirtyTracker:
+    """Kumpulan area layar yang berubah dalam satu frame.
+
+    Area ditandai per tile (`tile` piksel) lalu tile yang berdekatan digabung
+    jadi sedikit rect, supaya jumlah pass redraw dan rect untuk
+    `pygame.display.update` tetap kecil walau banyak sprite kecil bergerak.
+    Jika bagian layar yang kotor melebihi `full_ratio`, seluruh layar
+    dianggap kotor (redraw penuh lebih murah).
+    """
+
+    def __init__(self, size, tile=DIRTY_TILE_SIZE, full_ratio=DIRTY_FULL_RATIO):
+        self.width, self.height = size
+        self.tile = tile
+        self.cols = -(-self.width // tile)
+        self.rows = -(-self.height // tile)
+        self.full_ratio = full_ratio
+        self._tiles = set()
+        self.full = True
+
+    def invalidate(self):
+        """Tandai seluruh layar kotor"""
+        self.full = True
+
+    def add(self, rect):
+        if self.full:
+            return
+        t = self.tile
+        x0, y0 = max(rect.left, 0) // t, max(rect.top, 0) // t
+        x1 = min(rect.right - 1, self.width - 1) // t
+        y1 = min(rect.bottom - 1, self.height - 1) // t
+        tiles = self._tiles
+        for ty in range(y0, y1 + 1):
+            for tx in range(x0, x1 + 1):
+                tiles.add((tx, ty))
+        if len(tiles) > self.full_ratio * self.cols * self.rows:
+            self.full = True  # Sudah pasti redraw penuh, add() berikutnya dilewati
+
+    def rects(self):
+        """Rect kotor yang sudah digabung. Layar penuh jika `full`"""
+        if self.full:
+            return [pygame.Rect(0, 0, self.width, self.height)]
+        t = self.tile
+        # Gabung tile berurutan per baris jadi run, lalu run yang sama
+        # persis di baris berikutnya digabung ke bawah
+        open_runs = {}  # (x0, x1) -> [y0, y1]
+        done = []
+        rows = {}
+        for tx, ty in self._tiles:
+            rows.setdefault(ty, []).append(tx)
+        for ty in sorted(rows):
+            cols = sorted(rows[ty])
+            runs = []
+            start = prev = cols[0]
+            for tx in cols[1:]:
+                if tx != prev + 1:
+                    runs.append((start, prev))
+                    start = tx
+                prev = tx
+            runs.append((start, prev))
+            next_open = {}
+            for run in runs:
+                span = open_runs.pop(run, None)
+                if span is not None and span[1] == ty - 1:
+                    span[1] = ty
+                else:
+                    if span is not None:
+                        done.append((run, span))
+                    span = [ty, ty]
+                next_open[run] = span
+            done.extend(open_runs.items())
+            open_runs = next_open
+        done.extend(open_runs.items())
+
+        screen = pygame.Rect(0, 0, self.width, self.height)
+        return [pygame.Rect(x0 * t, y0 * t, (x1 - x0 + 1) * t, (y1 - y0 + 1) * t).clip(screen)
+                for (x0, x1), (y0, y1) in done]
+
+    def reset(self):
+        self._tiles.clear()
+        self.full = False
@@ -1,64 +1,266 @@
 import pygame
-from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, GREEN_BG, WHITE, BLACK, MAP_WIDTH, MAP_HEIGHT, YELLOW
-from src.models.grass import draw_swaying_clump
+from bisect import bisect_right
+from src.config import GREEN_BG, WHITE, BLACK, DIRTY_RECT_RENDERING
+from src.views.render_queue import RenderQueue
+from src.views.dirty_rects import DirtyTracker
+from src.views.minimap import Minimap
+from src.views.perf_overlay import PerfOverlay
+from src.models.grass import GRASS_CANVAS_MARGIN
+from src.utils.profiler import frame_profiler
+from src.utils.text_cache import get_font, text_cache
+
+MOVER_KINDS = ("player", "animal", "cat")
+TRACKED_KINDS = MOVER_KINDS + ("tree",)  # Item yang bisa berubah tampilan (gerak / highlight)
+HIGHLIGHT_PAD = 90  # Perbesaran rect yang pasti menutup lingkaran highlight (radius <= 40)
 
 class GameView:
-    def __init__(self, screen):
-        pygame.font.init()
-        self.font_small = pygame.font.Font(None, 20)
-        self.font_pixel = pygame.font.Font(None, 28)
-        self.screen = screen
-    
-    def render(self, player, trees, animals, cats, grass_clumps, camera, time_sec, popup, can_interact_with, boundary_trees=None):
-        self.screen.fill(GREEN_BG)
+    def __init__(self, screen, ground_layer=None, dirty_rects=DIRTY_RECT_RENDERING):
+        self.font_small = get_font(20)
+        self.font_pixel = get_font(28)
+        self.display = screen
+        self.ground_layer = ground_layer  # GroundLayer opsional, menggantikan rumput
+        if ground_layer is None:
+            # Frame digambar ke canvas bermargin lalu disalin ke layar: entry blit
+            # rumput (relatif ke origin grid) bisa di-blit apa adanya ke subsurface canvas
+            margin = GRASS_CANVAS_MARGIN
+            width, height = screen.get_size()
+            self._canvas = pygame.Surface((width + margin, height + margin)).convert()
+            self.screen = self._canvas.subsurface(pygame.Rect(margin, margin, width, height))
+        else:
+            self._canvas = None
+            self.screen = screen
+        self.render_queue = None
+        self._static_kinds = ("tree", "boundary_tree")
+        self.minimap = Minimap()
+        self.perf_overlay = PerfOverlay(frame_profiler)
         
-        drawables = []
-        if boundary_trees:
-            for bt in boundary_trees:
-                drawables.append(("boundary_tree", bt.rect.bottom, bt))
+        # Render dirty-rect (opsional): state frame sebelumnya untuk deteksi perubahan
+        self.dirty_tracker = DirtyTracker(screen.get_size()) if dirty_rects else None
+        self._last_frame_key = None
+        self._last_movers = {}  # id(obj) -> (rect layar, id image)
+        self._last_grass = None  # GrassField.pixel_state() frame sebelumnya
+        self._last_prompt = None
         
-        drawables.append(("sprite", player.rect.bottom, player))
-        for t in trees: drawables.append(("sprite", t.rect.bottom, t))
-        for a in animals: drawables.append(("sprite", a.rect.bottom, a))
-        for c in cats: drawables.append(("sprite", c.rect.bottom, c))
-        for g in grass_clumps: drawables.append(("grass", g["y"], g))
+        # Frame (dunia beku + gelap + panel popup) yang dipakai ulang selama popup terbuka
+        self._popup_frame = None
+        self._popup_owner = None
+    
+    def _get_render_queue(self, player, trees, animals, cats, boundary_trees):
+        """Render queue dibuat sekali; item statis diurutkan saat itu saja"""
+        if self.render_queue is None:
+            static_items = [("tree", t) for t in trees]
+            static_items += [("boundary_tree", bt) for bt in boundary_trees or ()]
+            movers = [("player", player)] + [("animal", a) for a in animals] + [("cat", c) for c in cats]
+            self.render_queue = RenderQueue(static_items, movers)
+        return self.render_queue
+    
+    def render(self, player, trees, animals, cats, grass_field, camera, time_sec, popup, can_interact_with, boundary_trees=None, spatial_grid=None, population=None):
+        if popup is not None and popup is self._popup_owner:
+            # Simulasi berhenti selama popup terbuka: cukup tampilkan frame yang disimpan
+            if self.dirty_tracker is None:
+                self.screen.blit(self._popup_frame, (0, 0))
+                self._present()
+            return
+        self._popup_frame = self._popup_owner = None
         
-        drawables.sort(key=lambda item: item[1])
+        profiler = frame_profiler
+        queue = self._get_render_queue(player, trees, animals, cats, boundary_trees)
+        with profiler.section("render.sort"):
+            if spatial_grid is not None:
+                # Culling: hanya entity yang beririsan dengan kamera
+                visible_static = spatial_grid.query_rect(camera, self._static_kinds)
+                visible_movers = spatial_grid.query_rect(camera, MOVER_KINDS)
+                if population is not None:
+                    visible_movers += population.query_rect(camera)
+                draw_list = queue.build(visible_movers, visible_static)
+            else:
+                draw_list = queue.build()
+        profiler.count("entities_drawn", len(draw_list))
+        profiler.count("entities_culled", queue.total_count() - len(draw_list))
         
-        for type, y, data in drawables:
-            if type == "sprite": data.draw(self.screen, camera)
-            elif type == "grass": draw_swaying_clump(self.screen, data, time_sec, camera)
-            elif type == "boundary_tree": data.draw(self.screen, camera)
+        # Rumput: goyangan & culling dihitung sekali, lalu digambar per potongan
+        # (batch blits) di sela sprite sesuai kedalaman
+        with profiler.section("render.grass"):
+            grass_count = 0 if self.ground_layer else grass_field.prepare(time_sec, camera)
         
+        prompt_rect = None
         if can_interact_with and not popup:
-            prompt_text = self.font_pixel.render("[SPASI]", True, WHITE)
-            prompt_bg = pygame.Surface((prompt_text.get_width() + 10, prompt_text.get_height() + 6))
-            prompt_bg.fill(BLACK); prompt_bg.set_alpha(180)
-            px = player.rect.centerx - camera.x - prompt_bg.get_width() // 2
-            py = player.rect.top - camera.y - 40
-            self.screen.blit(prompt_bg, (px, py))
-            self.screen.blit(prompt_text, (px + 5, py + 3))
-
-        # Minimap
-        self._draw_minimap(player, trees, animals, cats, camera)
+            prompt_w, prompt_h = self.font_pixel.size("[SPASI]")
+            prompt_rect = pygame.Rect(0, 0, prompt_w + 10, prompt_h + 6)
+            prompt_rect.midtop = (player.rect.centerx - camera.x, player.rect.top - camera.y - 40)
         
-        # Popup
-        if popup: popup.draw(self.screen)
+        with profiler.section("render.minimap"):
+            minimap_changed = self.minimap.update(time_sec, player, trees, animals, cats, boundary_trees, population)
+        overlay_rect = self.perf_overlay.update(time_sec)
+        
+        if popup is not None:
+            # Frame pertama popup: gambar dunia sekali, gelapkan, tambah panel, lalu simpan
+            self._draw_world(draw_list, grass_field, grass_count, camera)
+            self.minimap.draw(self.screen)
+            popup.draw(self.screen)
+            self._draw_instructions()
+            self._popup_frame = self.screen.copy()
+            self._popup_owner = popup
+            self._last_frame_key = None  # Setelah popup ditutup, redraw penuh
+            self._present()
+            return
+        
+        if self.dirty_tracker is None:
+            self._draw_world(draw_list, grass_field, grass_count, camera)
+            self._draw_hud(prompt_rect)
+            with profiler.section("render.flip"):
+                self._present()
+            return
+        
+        # Mode dirty-rect: kamera diam -> hanya area yang berubah yang digambar ulang
+        tracker = self.dirty_tracker
+        frame_key = camera.topleft
+        if frame_key != self._last_frame_key:
+            tracker.invalidate()
+            self._last_frame_key = frame_key
+        self._track_changes(draw_list, grass_field, grass_count, camera, prompt_rect)
+        if minimap_changed:
+            tracker.add(self.minimap.rect)
+        if overlay_rect:
+            tracker.add(overlay_rect)
+        rects = tracker.rects()
+        profiler.count("dirty_rects", len(rects))
+        if tracker.full:
+            self._draw_world(draw_list, grass_field, grass_count, camera)
+            self._draw_hud(prompt_rect)
+            with profiler.section("render.flip"):
+                self._present()
+        elif rects:
+            # Tiap rect kotor (tile berdekatan sudah digabung tracker) digambar
+            # di clip-nya sendiri, hanya dengan entity & rumput yang mengenainya
+            boxes = [self._screen_box(data, camera) for kind, data in draw_list]
+            for rect in rects:
+                self.screen.set_clip(rect)
+                self._draw_region(rect, draw_list, boxes, grass_field, grass_count, camera)
+                self._draw_hud(prompt_rect)
+            self.screen.set_clip(None)
+            with profiler.section("render.flip"):
+                self._present(rects)
+        tracker.reset()
+    
+    def _present(self, rects=None):
+        """Salin frame dari canvas (jika ada) ke layar, lalu flip atau update `rects` saja"""
+        if self._canvas is not None:
+            if rects is None:
+                self.display.blit(self.screen, (0, 0))
+            else:
+                self.display.blits([(self.screen, rect, rect) for rect in rects], doreturn=False)
+        if rects is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(rects)
+    
+    def _draw_world(self, draw_list, grass_field, grass_count, camera):
+        profiler = frame_profiler
+        with profiler.section("render.sprites"):
+            if self.ground_layer:
+                # Rumput sudah di-bake ke chunk
+                profiler.count("blits", self.ground_layer.draw(self.screen, camera))
+            else:
+                self.screen.fill(GREEN_BG)
             
-        # Instructions
-        inst_bg = pygame.Surface((600, 30)); inst_bg.set_alpha(200); inst_bg.fill(WHITE)
-        self.screen.blit(inst_bg, (10, 10))
-        self.screen.blit(self.font_small.render("WASD: Jalan | [SPASI]: Interaksi | ESC: Tutup", True, BLACK), (15, 15))
+            g = 0
+            for kind, data in draw_list:
+                if g < grass_count:
+                    g_end = grass_field.index_before(data.rect.bottom, g)
+                    grass_field.draw_range(self.screen, g, g_end)
+                    g = g_end
+                data.draw(self.screen, camera)
+            if g < grass_count:
+                grass_field.draw_range(self.screen, g, grass_count)
+        profiler.count("blits", len(draw_list) + grass_count)
+    
+    def _draw_region(self, region, draw_list, boxes, grass_field, grass_count, camera):
+        """Gambar ulang dunia di dalam `region` (clip sudah di-set); `boxes` = rect layar tiap item draw_list"""
+        profiler = frame_profiler
+        with profiler.section("render.sprites"):
+            if self.ground_layer:
+                profiler.count("blits", self.ground_layer.draw(self.screen, camera))
+            else:
+                self.screen.fill(GREEN_BG)
+            
+            hits = region.collidelistall(boxes)
+            positions, depths = grass_field.select(region) if grass_count else ([], [])
+            g = 0
+            for i in hits:
+                data = draw_list[i][1]
+                if g < len(positions):
+                    g_end = bisect_right(depths, data.rect.bottom, g)
+                    grass_field.draw_positions(self.screen, positions[g:g_end])
+                    g = g_end
+                data.draw(self.screen, camera)
+            if g < len(positions):
+                grass_field.draw_positions(self.screen, positions[g:])
+        profiler.count("blits", len(hits) + len(positions))
+    
+    def _draw_instructions(self):
+        self.screen.blit(text_cache.panel((600, 30), WHITE, 200), (10, 10))
+        self.screen.blit(text_cache.render("WASD: Jalan | [SPASI]: Interaksi | ESC: Tutup", 20, BLACK), (15, 15))
+    
+    def _draw_hud(self, prompt_rect):
+        with frame_profiler.section("render.hud"):
+            if prompt_rect:
+                prompt_text = text_cache.render("[SPASI]", 28, WHITE)
+                self.screen.blit(text_cache.panel(prompt_rect.size, BLACK, 180), prompt_rect)
+                self.screen.blit(prompt_text, (prompt_rect.x + 5, prompt_rect.y + 3))
 
-        pygame.display.flip()
+            # Minimap
+            self.minimap.draw(self.screen)
+            
+            # Instructions
+            self._draw_instructions()
+            
+            # Overlay profiler (F3)
+            self.perf_overlay.draw(self.screen)
+    
+    @staticmethod
+    def _screen_box(data, camera):
+        """Rect layar yang digambar item (diperbesar jika ada lingkaran highlight)"""
+        rect = data.rect.move(-camera.x, -camera.y)
+        if getattr(data, "highlight", False):
+            rect.inflate_ip(HIGHLIGHT_PAD, HIGHLIGHT_PAD)
+        return rect
     
-    def _draw_minimap(self, player, trees, animals, cats, camera):
-        SCALE = 0.08
-        MW, MH = int(MAP_WIDTH * SCALE), int(MAP_HEIGHT * SCALE)
-        minimap = pygame.Surface((MW, MH)); minimap.fill((20, 50, 20))
-        pygame.draw.rect(minimap, WHITE, (0,0,MW,MH), 2)
-        for t in trees: pygame.draw.circle(minimap, (0, 255, 0), (int(t.rect.centerx*SCALE), int(t.rect.centery*SCALE)), 3)
-        for a in animals: pygame.draw.circle(minimap, (255, 200, 0), (int(a.rect.centerx*SCALE), int(a.rect.centery*SCALE)), 3)
-        for c in cats: pygame.draw.circle(minimap, (255, 150, 0), (int(c.rect.centerx*SCALE), int(c.rect.centery*SCALE)), 3)
-        pygame.draw.circle(minimap, (255, 0, 0), (int(player.rect.centerx*SCALE), int(player.rect.centery*SCALE)), 4)
-        self.screen.blit(minimap, (SCREEN_WIDTH - MW - 10, 10))
+    def _track_changes(self, draw_list, grass_field, grass_count, camera, prompt_rect):
+        """Tandai area yang berubah sejak frame sebelumnya ke dirty tracker"""
+        tracker = self.dirty_tracker
+        
+        # Entity yang posisi, frame, atau highlight-nya berubah -> area lama & baru kotor
+        movers = {}
+        previous = self._last_movers
+        for kind, data in draw_list:
+            if kind not in TRACKED_KINDS:
+                continue
+            rect = self._screen_box(data, camera)
+            state = (tuple(rect), id(getattr(data, "image", None)))
+            key = id(data)
+            movers[key] = state
+            old = previous.pop(key, None)
+            if old != state:
+                tracker.add(rect)
+                if old is not None:
+                    tracker.add(pygame.Rect(old[0]))
+        for old in previous.values():
+            tracker.add(pygame.Rect(old[0]))
+        self._last_movers = movers
+        
+        # Rumput yang bergoyang ke piksel lain atau berganti fase atlas.
+        # Saat layar sudah penuh kotor (kamera bergerak) cukup simpan state-nya
+        grass = grass_field.pixel_state() if grass_count else None
+        if grass is not None and self._last_grass is not None and not tracker.full:
+            for rect in grass_field.changed_rects(self._last_grass):
+                tracker.add(rect)
+                if tracker.full:
+                    break
+        self._last_grass = grass
+        
+        # HUD: prompt muncul/hilang/pindah
+        if prompt_rect != self._last_prompt:
+            for rect in (prompt_rect, self._last_prompt):
+                if rect: tracker.add(rect)
+            self._last_prompt = prompt_rect
@@ -0,0 +1,70 @@
+import pygame
+from collections import OrderedDict
+from src.config import GREEN_BG, GROUND_CHUNK_SIZE, GROUND_CHUNK_CACHE
+
+
+class GroundLayer:
+    """Layer tanah statis yang dipecah jadi chunk persegi dan di-bake sekali.
+
+    Rumput (tanpa goyangan) digambar ke surface per chunk saat chunk pertama
+    kali terlihat. Pohon boundary tidak ikut di-bake supaya tetap di-depth-sort
+    dengan player & hewan. Hanya `max_chunks` surface terakhir yang
+    disimpan (LRU), jadi memori tetap kecil walau map besar.
+    """
+
+    def __init__(self, grass_field, chunk_size=GROUND_CHUNK_SIZE, max_chunks=GROUND_CHUNK_CACHE):
+        self.chunk_size = chunk_size
+        self.max_chunks = max_chunks
+        self._surfaces = OrderedDict()  # (cx, cy) -> Surface
+        self._items = {}                # (cx, cy) -> [(depth, sprite, world_pos)]
+
+        for depth, sprite, pos in grass_field.sprite_positions():
+            self._add_item(depth, sprite, pos)
+
+        # Urutkan sekali berdasarkan kedalaman supaya bake cukup sekali jalan
+        for items in self._items.values():
+            items.sort(key=lambda item: item[0])
+
+    def _add_item(self, depth, sprite, pos):
+        cs = self.chunk_size
+        x, y = pos
+        w, h = sprite.get_size()
+        for cx in range(int(x) // cs, int(x + w - 1) // cs + 1):
+            for cy in range(int(y) // cs, int(y + h - 1) // cs + 1):
+                self._items.setdefault((cx, cy), []).append((depth, sprite, pos))
+
+    def _bake_chunk(self, key):
+        cs = self.chunk_size
+        ox, oy = key[0] * cs, key[1] * cs
+        surf = pygame.Surface((cs, cs)).convert()
+        surf.fill(GREEN_BG)
+        for _, sprite, (x, y) in self._items.get(key, ()):
+            surf.blit(sprite, (x - ox, y - oy))
+        return surf
+
+    def get_chunk(self, key):
+        surf = self._surfaces.get(key)
+        if surf is None:
+            surf = self._bake_chunk(key)
+            self._surfaces[key] = surf
+            if len(self._surfaces) > self.max_chunks:
+                self._surfaces.popitem(last=False)
+        else:
+            self._surfaces.move_to_end(key)
+        return surf
+
+    def invalidate(self):
+        """Buang semua chunk yang sudah di-bake (misal setelah konten statis berubah)"""
+        self._surfaces.clear()
+
+    def draw(self, surface, camera):
+        """Blit chunk yang terlihat kamera. Mengembalikan jumlah chunk yang digambar"""
+        cs = self.chunk_size
+        x0, y0 = camera.left // cs, camera.top // cs
+        x1, y1 = (camera.right - 1) // cs, (camera.bottom - 1) // cs
+        count = 0
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                surface.blit(self.get_chunk((cx, cy)), (cx * cs - camera.x, cy * cs - camera.y))
+                count += 1
+        return count
@@ -1,5 +1,6 @@
 import pygame
 from src.config import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, YELLOW, BLACK, GRAY
+from src.utils.text_cache import get_font, text_cache
 
 class InfoPopup:
     def __init__(self, name, description, image_surface):
@@ -9,11 +10,10 @@ class InfoPopup:
         self.x = (SCREEN_WIDTH - self.width) // 2
         self.y = (SCREEN_HEIGHT - self.height) // 2
         
-        # Font initialization
-        pygame.font.init()
-        self.font_title = pygame.font.Font(None, 32)
-        self.font_text = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 20)
+        # Font bersama (tidak dibuat ulang per popup)
+        self.font_title = get_font(32)
+        self.font_text = get_font(24)
+        self.font_small = get_font(20)
         
         target_size = 100
         original_w, original_h = image_surface.get_size()
@@ -26,30 +26,14 @@ class InfoPopup:
             new_w = int(original_w * scale_factor)
             new_h = int(original_h * scale_factor)
             self.preview_image = pygame.transform.scale(image_surface, (new_w, new_h))
-    
-    def draw(self, surface):
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        surface.blit(overlay, (0, 0))
-        
-        rect_bg = pygame.Rect(self.x, self.y, self.width, self.height)
-        pygame.draw.rect(surface, WHITE, rect_bg, border_radius=4)
-        pygame.draw.rect(surface, (30, 30, 30), rect_bg.inflate(-6, -6), border_radius=4)
-
-        img_x = self.x + 20
-        img_y = self.y + (self.height - self.preview_image.get_height()) // 2
-        pygame.draw.rect(surface, (50, 50, 50), (img_x - 5, img_y - 5, self.preview_image.get_width() + 10, self.preview_image.get_height() + 10), border_radius=5)
-        surface.blit(self.preview_image, (img_x, img_y))
-        
-        text_start_x = self.x + 150
-        title_surf = self.font_title.render(self.name, True, YELLOW)
-        surface.blit(title_surf, (text_start_x, self.y + 25))
-        pygame.draw.line(surface, GRAY, (text_start_x, self.y + 60), (self.x + self.width - 20, self.y + 60), 2)
         
+        # Isi popup statis: layout & render sekali saja
+        self.panel = self._render_panel()
+    
+    def _wrap_lines(self, max_text_width):
         words = self.description.split()
         lines = []
         current_line = ""
-        max_text_width = self.width - 170 
 
         for word in words:
             test_line = current_line + word + " "
@@ -59,12 +43,42 @@ class InfoPopup:
                 lines.append(current_line)
                 current_line = word + " "
         lines.append(current_line)
+        return lines
+    
+    def _render_panel(self):
+        """Layout & render isi popup sekali ke satu surface"""
+        panel = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        rect_bg = panel.get_rect()
+        pygame.draw.rect(panel, WHITE, rect_bg, border_radius=4)
+        pygame.draw.rect(panel, (30, 30, 30), rect_bg.inflate(-6, -6), border_radius=4)
+
+        img_x = 20
+        img_y = (self.height - self.preview_image.get_height()) // 2
+        pygame.draw.rect(panel, (50, 50, 50), (img_x - 5, img_y - 5, self.preview_image.get_width() + 10, self.preview_image.get_height() + 10), border_radius=5)
+        panel.blit(self.preview_image, (img_x, img_y))
+        
+        text_start_x = 150
+        title_surf = self.font_title.render(self.name, True, YELLOW)
+        panel.blit(title_surf, (text_start_x, 25))
+        pygame.draw.line(panel, GRAY, (text_start_x, 60), (self.width - 20, 60), 2)
         
-        y_off = self.y + 75
-        for line in lines:
+        y_off = 75
+        for line in self._wrap_lines(self.width - 170):
             txt = self.font_text.render(line, True, WHITE)
-            surface.blit(txt, (text_start_x, y_off))
+            panel.blit(txt, (text_start_x, y_off))
             y_off += 25
             
-        close_txt = self.font_small.render("[ESC] Tutup", True, GRAY)
-        surface.blit(close_txt, (self.x + self.width - 100, self.y + self.height - 25))
+        close_txt = text_cache.render("[ESC] Tutup", 20, GRAY)
+        panel.blit(close_txt, (self.width - 100, self.height - 25))
+        return panel
+    
+    def dim(self, surface):
+        """Gelapkan seluruh layar di belakang popup"""
+        surface.blit(text_cache.panel((SCREEN_WIDTH, SCREEN_HEIGHT), BLACK, 150), (0, 0))
+    
+    def draw_panel(self, surface):
+        surface.blit(self.panel, (self.x, self.y))
+    
+    def draw(self, surface):
+        self.dim(surface)
+        self.draw_panel(surface)
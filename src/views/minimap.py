@@ -0,0 +1,123 @@
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional, fallback ke binning Python biasa
+    np = None
+
+import pygame
+from src.config import (
+    SCREEN_WIDTH, MAP_WIDTH, MAP_HEIGHT, WHITE,
+    MINIMAP_SCALE, MINIMAP_HZ, MINIMAP_DENSITY_THRESHOLD, MINIMAP_DENSITY_CELL,
+)
+
+MINIMAP_BG = (20, 50, 20)
+TREE_DOT = (0, 255, 0)
+BOUNDARY_DOT = (10, 90, 10)
+ANIMAL_DOT = (255, 200, 0)
+CAT_DOT = (255, 150, 0)
+PLAYER_DOT = (255, 0, 0)
+
+
+class Minimap:
+    """Minimap dengan background statis yang di-cache dan overlay dinamis.
+
+    Background (terrain, border, pohon, pohon boundary) dibuat sekali dan baru
+    dibuat ulang setelah `invalidate()`. Posisi hewan digambar ke overlay
+    paling banyak `hz` kali per detik; jika jumlahnya di atas
+    `density_threshold`, hewan digambar sebagai tekstur kepadatan beresolusi
+    rendah, jadi biayanya tetap walau ada ribuan entity. Hanya titik player
+    yang digambar tiap frame.
+    """
+
+    def __init__(self, scale=MINIMAP_SCALE, hz=MINIMAP_HZ, density_threshold=MINIMAP_DENSITY_THRESHOLD,
+                 density_cell=MINIMAP_DENSITY_CELL):
+        self.scale = scale
+        MW, MH = int(MAP_WIDTH * scale), int(MAP_HEIGHT * scale)
+        self.rect = pygame.Rect(SCREEN_WIDTH - MW - 10, 10, MW, MH)
+        self.interval = 1.0 / hz if hz else 0.0
+        self.density_threshold = density_threshold
+        self.density_cell = density_cell
+        self._background = None
+        self._overlay = None
+        self._last_update = None
+        self._player_pos = None
+
+    def invalidate(self):
+        """Buat ulang background (misal setelah pohon ditambah/dipindah)"""
+        self._background = None
+        self._last_update = None
+
+    def _build_background(self, trees, boundary_trees):
+        SCALE = self.scale
+        MW, MH = self.rect.size
+        bg = pygame.Surface((MW, MH)); bg.fill(MINIMAP_BG)
+        for bt in boundary_trees or ():
+            bg.set_at((int(bt.rect.centerx * SCALE), int(bt.rect.centery * SCALE)), BOUNDARY_DOT)
+        pygame.draw.rect(bg, WHITE, (0, 0, MW, MH), 2)
+        for t in trees: pygame.draw.circle(bg, TREE_DOT, (int(t.rect.centerx * SCALE), int(t.rect.centery * SCALE)), 3)
+        return bg
+
+    def _animal_positions(self, animals, population):
+        if population is not None:
+            n = population.count
+            return population.x[:n], population.y[:n]
+        centers = [a.rect.center for a in animals]
+        return [c[0] for c in centers], [c[1] for c in centers]
+
+    def _draw_density(self, surface, xs, ys):
+        """Kepadatan hewan per cell `density_cell` piksel minimap"""
+        cell = self.density_cell
+        MW, MH = self.rect.size
+        bw, bh = max(1, MW // cell), max(1, MH // cell)
+        if np is not None:
+            counts, _, _ = np.histogram2d(np.asarray(xs), np.asarray(ys), bins=(bw, bh),
+                                          range=((0, MAP_WIDTH), (0, MAP_HEIGHT)))
+            level = np.clip(counts / max(counts.max(), 1.0) * 2.0, 0.0, 1.0)
+            rgb = np.zeros((bw, bh, 3), dtype=np.uint8)
+            rgb[..., 0] = (level * ANIMAL_DOT[0]).astype(np.uint8)
+            rgb[..., 1] = (level * ANIMAL_DOT[1]).astype(np.uint8)
+            texture = pygame.transform.scale(pygame.surfarray.make_surface(rgb), (bw * cell, bh * cell))
+            surface.blit(texture, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+            return
+        counts = {}
+        sx, sy = bw / MAP_WIDTH, bh / MAP_HEIGHT
+        for x, y in zip(xs, ys):
+            key = (min(int(x * sx), bw - 1), min(int(y * sy), bh - 1))
+            counts[key] = counts.get(key, 0) + 1
+        peak = max(counts.values(), default=1)
+        for (cx, cy), count in counts.items():
+            level = min(count / peak * 2.0, 1.0)
+            color = (int(ANIMAL_DOT[0] * level), int(ANIMAL_DOT[1] * level), 0)
+            surface.fill(color, (cx * cell, cy * cell, cell, cell), special_flags=pygame.BLEND_RGB_ADD)
+
+    def update(self, time_sec, player, trees, animals, cats, boundary_trees=None, population=None):
+        """Perbarui overlay jika sudah waktunya. Mengembalikan True jika tampilan berubah"""
+        changed = False
+        if self._background is None:
+            self._background = self._build_background(trees, boundary_trees)
+        if self._last_update is None or time_sec - self._last_update >= self.interval:
+            self._last_update = time_sec
+            SCALE = self.scale
+            overlay = self._background.copy()
+            xs, ys = self._animal_positions(animals, population)
+            if len(xs) > self.density_threshold:
+                self._draw_density(overlay, xs, ys)
+            else:
+                for x, y in zip(xs, ys):
+                    pygame.draw.circle(overlay, ANIMAL_DOT, (int(x * SCALE), int(y * SCALE)), 3)
+            for c in cats: pygame.draw.circle(overlay, CAT_DOT, (int(c.rect.centerx * SCALE), int(c.rect.centery * SCALE)), 3)
+            self._overlay = overlay
+            changed = True
+
+        player_pos = (int(player.rect.centerx * self.scale), int(player.rect.centery * self.scale))
+        if player_pos != self._player_pos:
+            self._player_pos = player_pos
+            changed = True
+        return changed
+
+    def draw(self, surface):
+        """Blit minimap hasil `update()` terakhir"""
+        if self._overlay is None:
+            return
+        surface.blit(self._overlay, self.rect)
+        px, py = self._player_pos
+        pygame.draw.circle(surface, PLAYER_DOT, (self.rect.x + px, self.rect.y + py), 4)
@@ -0,0 +1,76 @@
+import pygame
+from src.config import FPS, BASE_TICK_HZ, PERF_OVERLAY_HZ, WHITE, BLACK
+from src.utils.text_cache import get_font
+
+OVERLAY_FONT_SIZE = 18
+OVERLAY_BG_ALPHA = 190
+SLOW_COLOR = (255, 120, 80)  # Section yang p95-nya melebihi budget frame
+FRAME_BUDGET_MS = 1000.0 / (FPS or BASE_TICK_HZ)
+
+
+class PerfOverlay:
+    """Overlay statistik FrameProfiler (F3): waktu per section dan counter.
+
+    Teks berubah tiap frame, jadi tidak lewat TextCache; surface overlay
+    dibangun ulang paling banyak `hz` kali per detik lalu di-blit apa adanya.
+    """
+
+    def __init__(self, profiler, pos=(10, 50), hz=PERF_OVERLAY_HZ):
+        self.profiler = profiler
+        self.pos = pos
+        self.interval = 1.0 / hz if hz else 0.0
+        self.font = get_font(OVERLAY_FONT_SIZE)
+        self.rect = pygame.Rect(pos, (0, 0))
+        self._surface = None
+        self._last_update = None
+        self._visible = False
+
+    def _lines(self):
+        stats = self.profiler.stats()
+        frame = stats.get("frame")
+        lines = []
+        if frame:
+            fps = 1000.0 / frame["mean"] if frame["mean"] else 0.0
+            lines.append((f"{fps:5.0f} fps  ({self.profiler.frames} frame)", WHITE))
+        lines.append((f"{'section':<18}{'mean':>7}{'p50':>7}{'p95':>7}{'p99':>7}", WHITE))
+        for name in self.profiler.section_names():
+            s = stats[name]
+            color = SLOW_COLOR if s["p95"] > FRAME_BUDGET_MS else WHITE
+            lines.append((f"{name:<18}{s['mean']:7.2f}{s['p50']:7.2f}{s['p95']:7.2f}{s['p99']:7.2f}", color))
+        for name in self.profiler.counter_names():
+            s = stats[name]
+            lines.append((f"{name:<18}{s['mean']:7.0f}{s['p50']:7.0f}{s['p95']:7.0f}{s['max']:7.0f}", WHITE))
+        return lines
+
+    def _build(self):
+        line_h = self.font.get_linesize()
+        rendered = [self.font.render(text, True, color) for text, color in self._lines()]
+        width = max(s.get_width() for s in rendered) + 12
+        height = line_h * len(rendered) + 8
+        surf = pygame.Surface((width, height), pygame.SRCALPHA)
+        surf.fill((*BLACK, OVERLAY_BG_ALPHA))
+        for i, line in enumerate(rendered):
+            surf.blit(line, (6, 4 + i * line_h))
+        return surf
+
+    def update(self, time_sec):
+        """Bangun ulang overlay jika sudah waktunya. Mengembalikan rect yang berubah (atau None)"""
+        visible = self.profiler.show_overlay
+        if not visible:
+            if self._visible:
+                self._visible = False
+                self._surface = None
+                return self.rect.copy()
+            return None
+        if self._visible and self._last_update is not None and time_sec - self._last_update < self.interval:
+            return None
+        self._visible = True
+        self._last_update = time_sec
+        old = self.rect.copy()
+        self._surface = self._build()
+        self.rect = pygame.Rect(self.pos, self._surface.get_size())
+        return self.rect.union(old)
+
+    def draw(self, surface):
+        if self._surface is not None:
+            surface.blit(self._surface, self.rect)
@@ -0,0 +1,91 @@
+from operator import itemgetter
+
+
+def _depth_of(obj):
+    """Kedalaman (sumbu y) untuk depth sorting"""
+    return obj.rect.bottom
+
+
+class RenderQueue:
+    """Daftar gambar ber-urutan kedalaman yang dipakai ulang antar frame.
+
+    Item statis (pohon, pohon boundary) diurutkan sekali saat dibuat
+    dan hanya dirujuk lewat rank-nya. Tiap frame hanya entity bergerak yang
+    diurutkan, lalu digabung (merge) ke item statis yang terlihat. Entry
+    `(kind, obj)` dibuat sekali; alokasi per frame hanya sebanding jumlah mover.
+    """
+
+    def __init__(self, static_items=(), movers=()):
+        self._frame = []
+        self._movers = []  # [(depth, entry)], dipakai ulang tiap frame
+        self.set_static(static_items)
+        self.set_movers(movers)
+
+    def set_static(self, static_items):
+        """Set ulang item statis dari iterable `(kind, obj)` dan urutkan sekali"""
+        items = sorted(((_depth_of(obj), (kind, obj)) for kind, obj in static_items), key=itemgetter(0))
+        self._static_depths = [depth for depth, _ in items]
+        self._static_entries = [entry for _, entry in items]
+        self._rank = {id(entry[1]): i for i, entry in enumerate(self._static_entries)}
+
+    def __len__(self):
+        return len(self._static_entries)
+
+    def total_count(self):
+        """Jumlah semua item terdaftar (statis + mover)"""
+        return len(self._static_entries) + len(self._mover_entries)
+
+    def set_movers(self, movers):
+        """Daftarkan entity bergerak dari iterable `(kind, obj)`"""
+        self._mover_entries = {id(obj): (kind, obj) for kind, obj in movers}
+
+    def build(self, visible_movers=None, visible_static=None):
+        """Gabungkan item statis dan entity bergerak jadi satu urutan gambar.
+
+        Args:
+            visible_movers: iterable entity bergerak yang terlihat. None
+                berarti semua mover yang terdaftar.
+            visible_static: iterable objek statis yang terlihat (misal hasil
+                query spatial grid). None berarti semua item statis.
+
+        Returns:
+            List `(kind, obj)` terurut dari belakang ke depan. List ini milik
+            queue dan dipakai ulang pada pemanggilan berikutnya.
+        """
+        moving = self._movers
+        moving.clear()
+        mover_entries = self._mover_entries
+        if visible_movers is None:
+            for entry in mover_entries.values():
+                moving.append((entry[1].rect.bottom, entry))
+        else:
+            for obj in visible_movers:
+                entry = mover_entries.get(id(obj))
+                if entry is not None:
+                    moving.append((obj.rect.bottom, entry))
+        # Hanya mover yang diurutkan; jumlahnya kecil dibanding item statis
+        moving.sort(key=itemgetter(0))
+
+        if visible_static is None:
+            ranks = range(len(self._static_entries))
+        else:
+            rank = self._rank
+            ranks = [rank[id(obj)] for obj in visible_static if id(obj) in rank]
+            ranks.sort()
+
+        # Merge: sisipkan mover di antara item statis sesuai kedalamannya
+        frame = self._frame
+        frame.clear()
+        depths = self._static_depths
+        entries = self._static_entries
+        m, n_movers = 0, len(moving)
+        for r in ranks:
+            depth = depths[r]
+            while m < n_movers and moving[m][0] <= depth:
+                frame.append(moving[m][1])
+                m += 1
+            frame.append(entries[r])
+        while m < n_movers:
+            frame.append(moving[m][1])
+            m += 1
+        return frame
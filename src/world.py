@@ -0,0 +1,179 @@
+import random
+from src.config import (
+    MAP_WIDTH, MAP_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT, GRASS_SWAY_PHASES, GRASS_SPRITE_SEED, SIMULATION_BACKEND,
+    WORLD_SEED, ENTITY_SCHEDULER, THREADED_SIMULATION,
+)
+from src.models.player import Player
+from src.models.tree import Tree
+from src.models.boundary_tree import create_boundary_trees
+from src.models.animal import Animal
+from src.models.cat import Cat
+from src.models.population import Population, np
+from src.models.grass import create_grass_clump_sprite, create_grass_clump_frames, spawn_all_grass_clumps, GrassField
+from src.controllers.game_controller import GameController
+from src.utils.helpers import get_safe_random_pos
+from src.utils.spatial_grid import SpatialGrid
+from src.utils.profiler import startup_profiler, frame_profiler
+from src.utils.rng import WorldRng
+
+GRASS_CLUMP_COUNT = 3000
+
+# Pohon interaktif: (offset x, offset y dari tengah map, tipe, nama, deskripsi)
+TREE_SPAWNS = [
+    (-800, -500, "Beringin", "Pohon Beringin", "Beringin adalah pohon besar yang tumbuh di daerah tropis. Pohon ini memiliki ciri khas berupa akar gantung yang banyak dan menjuntai seperti rambut. Beringin berasal dan banyak ditemukan di wilayah Asia Tenggara, termasuk Indonesia."),
+    (800, -500, "oak", "Pohon Oak", "Pohon Oak merupakan pohon besar yang terkenal kokoh dan dapat hidup sangat lama. Ciri khasnya adalah batang tebal serta daun bercuping yang lebar. Pohon ini berasal dari wilayah beriklim sedang seperti Amerika Utara dan Eropa."),
+    (-800, 500, "maple", "Pohon Maple", "Pohon Maple adalah pohon berdaun lebar yang menghasilkan getah manis yang biasa diolah menjadi sirup maple. Ciri utamanya adalah bentuk daun bercabang yang bisa berubah warna saat musim gugur. Maple berasal dari Kanada dan negara beriklim dingin lainnya di Amerika Utara."),
+    (800, 500, "pine", "Pohon Cemara", "Pohon Cemara (Pine) adalah pohon berdaun jarum yang tetap hijau sepanjang tahun. Ciri-cirinya meliputi bentuk pohon yang meruncing ke atas dan daun berbentuk jarum tipis. Pohon ini berasal dari daerah pegunungan serta wilayah beriklim sedang."),
+    (-400, 0, "mangga", "Pohon Mangga", "Pohon Mangga merupakan pohon buah tropis yang sangat populer. Pohon ini memiliki ciri daun panjang dan buah manis beraroma khas. Mangga berasal dari Asia Selatan, tetapi kini telah tumbuh luas di berbagai daerah tropis, termasuk Indonesia."),
+    (400, 0, "alpukat", "Pohon Alpukat", "Pohon Alpukat adalah pohon buah yang menghasilkan buah bergizi dengan daging lembut berwarna hijau kekuningan. Ciri khasnya terletak pada daunnya yang lebar serta buah yang kaya lemak sehat. Alpukat berasal dari wilayah Amerika Tengah dan Selatan."),
+    (0, -400, "rambutan", "Pohon Rambutan", "Pohon Rambutan adalah pohon tropis yang menghasilkan buah unik dengan kulit berbulu dan rasa manis. Ciri buahnya yang berbulu menjadi tanda khas yang mudah dikenali. Rambutan berasal dari wilayah Asia Tenggara."),
+    (0, 400, "sakura", "Pohon Sakura", "Pohon Sakura merupakan pohon berbunga yang sangat terkenal di Jepang. Ciri utamanya adalah bunga berwarna merah muda lembut yang mekar di musim semi. Sakura berasal dari Jepang dan beberapa wilayah Asia Timur lainnya."),
+]
+
+# HEWAN - Karakteristik tiap spesies ada di tabel src/models/species.py
+ANIMAL_SPAWNS = [
+    ("sapi", "Sapi", "Sapi adalah hewan ternak besar yang banyak dipelihara manusia. Hewan ini memiliki tubuh besar dan dikenal sebagai penghasil susu. Sapi biasanya hidup di lingkungan peternakan atau padang rumput."),
+    ("anak_sapi", "Anak Sapi", "Anak sapi adalah sapi muda yang masih dalam masa pertumbuhan. Ciri utamanya adalah tubuh yang lebih kecil dan sifat yang masih bergantung pada induknya. Anak sapi hidup di peternakan bersama induknya."),
+    ("domba", "Domba", "Domba adalah hewan ternak yang dikenal karena dapat menghasilkan bulu tebal dan lembut. Ciri khas domba adalah tubuhnya yang diselimuti bulu wol. Domba hidup di padang rumput, peternakan, atau daerah dataran tinggi."),
+    ("babi", "Babi", "Babi merupakan hewan omnivora yang terkenal sangat cerdas. Ciri utamanya adalah hidung moncong dan sifatnya yang suka mengeksplor lingkungan. Babi biasanya hidup di peternakan atau hutan."),
+    ("ayam", "Ayam", "Ayam adalah unggas yang sering dipelihara untuk diambil daging dan telurnya. Ciri khasnya adalah kebiasaan berkokok pada pagi hari, terutama ayam jantan. Ayam hidup di kandang atau pekarangan rumah."),
+    ("ayam_jantan", "Ayam Jantan", "Ayam jantan atau jago adalah ayam pejantan yang memiliki jengger merah dan ekor panjang yang indah. Ciri khasnya adalah suara kokokoknya yang keras di pagi hari. Ayam jantan sering dipelihara sebagai penjaga kandang."),
+    ("kambing", "Kambing", "Kambing adalah hewan ternak yang lincah dan mudah beradaptasi. Ciri-cirinya termasuk tubuh ramping, tanduk kecil, dan kebiasaan suka memanjat tempat yang tinggi. Kambing hidup di perbukitan, peternakan, atau padang rumput."),
+    ("anjing", "Anjing", "Anjing adalah hewan peliharaan yang setia dan pintar. Dikenal sebagai sahabat terbaik manusia karena sifatnya yang loyal dan mudah dilatih. Anjing hidup di rumah atau peternakan sebagai penjaga."),
+    ("kalkun", "Kalkun", "Kalkun adalah burung Dengan Kaki yang sangat panjang serta tubuh yang besar dan memiliki telur yang sangat besar. Kalkun sering dipelihara oleh orang luar negeri dengan kandang yang besar."),
+]
+
+CAT_SPAWNS = [
+    ("Si Meng", "Kucing kesayangan."),
+]
+
+
+def create_world(grass_count=GRASS_CLUMP_COUNT, species_counts=None, extra_trees=0, cat_count=1,
+                 backend=SIMULATION_BACKEND, seed=WORLD_SEED, scheduler=ENTITY_SCHEDULER, threaded=THREADED_SIMULATION):
+    """Membuat seluruh isi dunia game dan mengembalikan GameController-nya.
+
+    Args:
+        grass_count: jumlah clump rumput
+        species_counts: {species: jumlah} untuk hewan di ANIMAL_SPAWNS (default 1 per spesies)
+        extra_trees: pohon interaktif tambahan (tipe acak dari TREE_SPAWNS) di posisi acak
+        cat_count: jumlah kucing
+        backend: "object" atau "numpy" (lihat SIMULATION_BACKEND)
+        seed: seed dunia; seed sama -> dunia & jalannya simulasi sama (None = acak)
+        scheduler: penjadwal update entity, "full" / "lod" / "budget" (lihat ENTITY_SCHEDULER)
+        threaded: backend "numpy" disimulasikan di worker thread (lihat THREADED_SIMULATION)
+    """
+    species_counts = species_counts or {}
+    world_rng = WorldRng(seed)
+    print(f"Seed dunia: {world_rng.seed}")
+    spawn_rng = world_rng.stream("spawn")
+    
+    startup_profiler.begin("player")
+    player = Player(MAP_WIDTH // 2, MAP_HEIGHT // 2)
+    
+    startup_profiler.begin("trees")
+    CX = MAP_WIDTH // 2
+    CY = MAP_HEIGHT // 2
+    trees = [Tree(CX + dx, CY + dy, tree_type, name, desc) for dx, dy, tree_type, name, desc in TREE_SPAWNS]
+    
+    # Spatial grid dipakai untuk cek spawn, culling render, dan interaksi
+    spatial_grid = SpatialGrid()
+    for t in trees: spatial_grid.insert(t, kind="tree")
+    for _ in range(extra_trees):
+        _, _, tree_type, name, desc = spawn_rng.choice(TREE_SPAWNS)
+        safe_x, safe_y = get_safe_random_pos(trees, min_dist=150, grid=spatial_grid, rng=spawn_rng)
+        trees.append(Tree(safe_x, safe_y, tree_type, name, desc))
+        spatial_grid.insert(trees[-1], kind="tree")
+    
+    startup_profiler.begin("animals")
+    animals = []
+    # Backend "numpy": semua hewan disimulasikan sebagai array di Population,
+    # `animals` berisi view ringan dan tidak dimasukkan ke spatial grid
+    population = None
+    if backend == "numpy":
+        if np is not None:
+            population = Population(rng=world_rng.numpy("ai", "population"))
+        else:
+            print("[WARNING] NumPy tidak tersedia, pakai backend object")
+    for species, name, desc in ANIMAL_SPAWNS:
+        for i in range(species_counts.get(species, 1)):
+            safe_x, safe_y = get_safe_random_pos(trees + animals, min_dist=100, grid=spatial_grid, rng=spawn_rng,
+                                                 population=population)
+            if population is not None:
+                animals.append(population.add(species, safe_x, safe_y, name, desc))
+            else:
+                animals.append(Animal(safe_x, safe_y, species, name, desc, world_rng.stream("ai", species, i)))
+                spatial_grid.insert(animals[-1], kind="animal")
+
+    # Kucing
+    cats = []
+    for i in range(cat_count):
+        name, desc = CAT_SPAWNS[i % len(CAT_SPAWNS)]
+        safe_x, safe_y = get_safe_random_pos(trees + animals + cats, min_dist=120, grid=spatial_grid, rng=spawn_rng,
+                                             population=population)
+        cats.append(Cat(safe_x, safe_y, name, desc, world_rng.stream("ai", "cat", i)))
+        spatial_grid.insert(cats[-1], kind="cat")
+
+    print("Menyiapkan rumput...")
+    startup_profiler.begin("grass")
+    # Varian clump deterministik supaya sprite-nya bisa dimuat dari cache disk
+    variant_rng = random.Random(GRASS_SPRITE_SEED)
+    grass_variants = [(variant_rng.randint(25,40), variant_rng.randint(15,30), variant_rng.getrandbits(32)) for _ in range(5)]
+    if GRASS_SWAY_PHASES:
+        # Atlas fase goyangan: frame 0 (tegak) dipakai sebagai sprite clump
+        grass_frames = [create_grass_clump_frames(w, h, GRASS_SWAY_PHASES, seed=seed) for w, h, seed in grass_variants]
+        grass_cache = [frames[0] for frames in grass_frames]
+    else:
+        grass_frames = None
+        grass_cache = [create_grass_clump_sprite(w, h, seed=seed) for w, h, seed in grass_variants]
+    all_grass = GrassField(spawn_all_grass_clumps(grass_count, grass_cache, world_rng.stream("grass")), grass_frames)
+    
+    print("Menyiapkan pohon boundary...")
+    startup_profiler.begin("boundary_trees")
+    boundary_trees = create_boundary_trees(MAP_WIDTH, MAP_HEIGHT, spacing=80, margin=50,
+                                           seed=world_rng.int_seed("boundary_trees"))
+    
+    startup_profiler.begin("mvc_setup")
+    return GameController(player, trees, animals, cats, all_grass, boundary_trees, spatial_grid, population, scheduler,
+                          threaded)
+
+
+def simulate_tick(controller, move=None):
+    """Satu tick simulasi (SIM_HZ per detik).
+
+    `move` adalah arah (dx, dy) hasil skrip (benchmark); None berarti dari keyboard.
+    """
+    profiler = frame_profiler
+    popup_active = controller.popup is not None
+    controller.begin_tick()
+    with profiler.section("input"):
+        controller.handle_input(popup_active, move)
+    with profiler.section("interactions"):
+        controller.update_interactions()
+    with profiler.section("entities"):
+        controller.update_cats(popup_active)
+    profiler.count("sim_ticks")
+
+
+def render_frame(controller, view, time_sec, alpha=1.0):
+    """Render satu frame dengan posisi entity di-interpolasi `alpha` di antara dua tick"""
+    profiler = frame_profiler
+    controller.sync_simulation()  # Mode worker: tick frame ini berjalan selama render
+    controller.interpolate(alpha)
+    with profiler.section("camera"):
+        controller.update_camera(SCREEN_WIDTH, SCREEN_HEIGHT)
+    with profiler.section("render"):
+        view.render(
+            controller.player,
+            controller.trees,
+            controller.animals,
+            controller.cats,
+            controller.grass_clumps,
+            controller.camera,
+            time_sec,
+            controller.popup,
+            controller.can_interact_with,
+            controller.boundary_trees,
+            controller.spatial_grid,
+            controller.population
+        )
+    controller.end_interpolation()